@@ -1,3 +1,27 @@
-from .adapter import add_langchain_tool_to_server
+import importlib
 
-__all__ = ["add_langchain_tool_to_server"]
+# Exports are imported on first access, so importing the package (e.g. to
+# spawn a short-lived stdio server) does not load mcp or LangChain up front.
+_EXPORTS = {
+    "add_langchain_tool_to_server": ".adapter",
+    "ArtifactBudget": ".artifact_budget",
+    "ArtifactCache": ".artifact_cache",
+    "PriorityScheduler": ".scheduling",
+    "ResultCache": ".result_cache",
+    "RetryPolicy": ".retrying",
+    "TracingPolicy": ".tracing",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,11 +1,36 @@
-from mcp.server import FastMCP
-from langchain.tools import Tool
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from mcp.server.fastmcp.utilities.func_metadata import ArgModelBase, FuncMetadata
+from pydantic import BaseModel, Field
+from pydantic.json_schema import SkipJsonSchema
+from pydantic_core import to_json, to_jsonable_python
 import re
 import functools
-from mcp.types import ImageContent, EmbeddedResource, BlobResourceContents
+import inspect
+import mimetypes
+import os
+from mcp.types import (
+    BlobResourceContents,
+    CallToolResult,
+    EmbeddedResource,
+    ImageContent,
+    TextContent,
+)
+from .artifact_cache import ArtifactCache, default_artifact_cache
+from .resources import get_tool_resources
+
+if TYPE_CHECKING:
+    from langchain_core.tools import BaseTool
+    from mcp.server import FastMCP
 
+    from .artifact_budget import ArtifactBudget
+    from .result_cache import ResultCache
+    from .retrying import RetryPolicy
+    from .scheduling import PriorityScheduler
+    from .tracing import TracingPolicy
 
-def reconstruct_func_from_tool(tool: Tool):
+
+def reconstruct_func_from_tool(tool: "BaseTool"):
     """
     Reconstructs a function from a LangChain tool to be compatible with MCP.
 
@@ -27,9 +52,9 @@ def reconstruct_func_from_tool(tool: Tool):
     if description is not None:
         wrapper.__doc__ = description
 
-    # Add args schema data if needed
-    if args_schema is not None and not hasattr(wrapper, "__annotations__"):
-        wrapper.__annotations__ = args_schema.model_json_schema()
+    # Keep the args schema so the server can validate against it directly
+    if args_schema is not None:
+        wrapper.args_schema = args_schema
 
     # Copy the response_format attribute if it exists
     if hasattr(tool, "response_format"):
@@ -38,6 +63,172 @@ def reconstruct_func_from_tool(tool: Tool):
     return wrapper
 
 
+def inject_tool_resources(func, resources, tool_resources):
+    """
+    Passes open server resources to a function as keyword arguments.
+
+    The injected parameters are removed from the function's signature, so they
+    are not exposed to MCP clients as tool arguments.
+
+    Args:
+        func: The function to wrap
+        resources: A mapping of keyword argument names to resource factories
+        tool_resources: The ToolResources the factories are declared with
+
+    Returns:
+        A function that receives the resources on every call
+    """
+    resources = dict(resources)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        for name, factory in resources.items():
+            kwargs[name] = tool_resources.get(factory)
+        return func(*args, **kwargs)
+
+    signature = inspect.signature(func)
+    wrapper.__signature__ = signature.replace(
+        parameters=[
+            parameter
+            for parameter in signature.parameters.values()
+            if parameter.name not in resources
+        ]
+    )
+
+    return wrapper
+
+
+def _requested_priority(server):
+    """
+    Read the priority class a client requested for the current tool call.
+
+    Clients request a class with the "priority" key of the request's _meta.
+
+    Args:
+        server: The FastMCP server handling the call
+
+    Returns:
+        The requested priority class, or None
+    """
+    try:
+        meta = server._mcp_server.request_context.meta
+    except LookupError:
+        return None
+    return getattr(meta, "priority", None)
+
+
+def schedule_tool_calls(func, server, scheduler, priority):
+    """
+    Runs a function's calls through a PriorityScheduler.
+
+    Args:
+        func: The function to wrap
+        server: The FastMCP server the function is registered with
+        scheduler: The PriorityScheduler granting execution slots
+        priority: The default priority class of the calls
+
+    Returns:
+        An async function that waits for a slot and runs func in a worker thread
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        call_priority = scheduler.resolve(_requested_priority(server), priority)
+        return await scheduler.run(call_priority, func, *args, **kwargs)
+
+    return wrapper
+
+
+def compile_arg_model(args_schema, exclude=frozenset()):
+    """
+    Builds the FastMCP argument model for a LangChain args_schema.
+
+    The returned model subclasses the args_schema itself, so FastMCP validates
+    incoming arguments once with the schema's own compiled pydantic validator
+    (including any custom validators) and passes the validated values straight
+    to the tool function. Models are built once per args_schema.
+
+    Args:
+        args_schema: A pydantic model class describing the tool's arguments
+        exclude: Names of fields that are not tool arguments (e.g. injected
+            resources). Excluded fields are optional, hidden from the JSON
+            schema and left out of the validated arguments; the schema's
+            validators still apply to the other fields.
+
+    Returns:
+        An ArgModelBase subclass, or None if args_schema is not a pydantic model
+    """
+    # Checked before the cache lookup: JSON schema dicts are not hashable
+    if not (isinstance(args_schema, type) and issubclass(args_schema, BaseModel)):
+        return None
+    return _compile_arg_model(args_schema, frozenset(exclude))
+
+
+class _InjectedArgModel(ArgModelBase):
+    """An argument model whose injected fields are not passed to the tool."""
+
+    _injected: ClassVar[frozenset] = frozenset()
+
+    def model_dump_one_level(self):
+        kwargs = super().model_dump_one_level()
+        for name in self._injected:
+            kwargs.pop(name, None)
+        return kwargs
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_arg_model(args_schema, exclude):
+    namespace = {"__module__": args_schema.__module__}
+    injected = exclude & args_schema.model_fields.keys()
+    if not injected:
+        return type(
+            f"{args_schema.__name__}Arguments", (args_schema, ArgModelBase), namespace
+        )
+
+    # Injected fields are overridden rather than dropped, so the subclass keeps
+    # the args_schema's validators and model_config
+    namespace["__annotations__"] = {name: SkipJsonSchema[Any] for name in injected}
+    namespace.update(
+        {name: Field(default=None, exclude=True) for name in injected},
+        _injected=frozenset(injected),
+    )
+    return type(
+        f"{args_schema.__name__}Arguments",
+        (args_schema, _InjectedArgModel),
+        namespace,
+    )
+
+
+class StructuredOutputMetadata(FuncMetadata):
+    """
+    FuncMetadata that serializes structured tool results in a single pass.
+
+    FastMCP validates each result against the output model, dumps it, and then
+    serializes it again as indented JSON for the text content. Here results
+    (dicts, lists, pydantic models, ...) are converted to JSON-compatible data
+    once by pydantic-core and encoded as compact JSON for the text content.
+    The data is still validated against the output model, with its compiled
+    validator and without building a model instance, so results that do not
+    match the output schema fail like they do in FastMCP.
+    """
+
+    def convert_result(self, result):
+        if isinstance(result, CallToolResult):
+            self._validate(result.structuredContent)
+            return result
+
+        data = to_jsonable_python(result, by_alias=True, fallback=str)
+        text = data if isinstance(data, str) else to_json(data).decode()
+        structured = {"result": data} if self.wrap_output else data
+        self._validate(structured)
+
+        return [TextContent(type="text", text=text)], structured
+
+    def _validate(self, structured):
+        if self.output_model is not None:
+            self.output_model.__pydantic_validator__.validate_python(structured)
+
+
 def _extract_mime_type(data_uri):
     """
     Extract the MIME type from a data URI.
@@ -54,7 +245,96 @@ def _extract_mime_type(data_uri):
     return None
 
 
-def handle_artifact_response(func):
+def _data_uri(path, encoded):
+    """
+    Build a data URI for base64 encoded file contents.
+
+    Args:
+        path: Path of the file, used to guess its MIME type
+        encoded: The base64 encoded file contents
+
+    Returns:
+        A data URI string
+    """
+    mime_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    return f"data:{mime_type};base64,{encoded}"
+
+
+def _image_content(file_data):
+    mime_type = _extract_mime_type(file_data)
+    return ImageContent(type="image", data=file_data, mimeType=mime_type)
+
+
+def _file_resource(file_name, file_data):
+    mime_type = _extract_mime_type(file_data)
+    return EmbeddedResource(
+        type="resource",
+        resource=BlobResourceContents(
+            blob=file_name,
+            uri=file_data,
+            mimeType=mime_type,
+        ),
+    )
+
+
+def _artifact_to_content(artifact, artifact_cache, artifact_budget=None):
+    """
+    Convert a LangChain artifact to MCP content.
+
+    Artifacts carry their data either inline as a data URI ("url" for images,
+    "file_data" for files) or by reference as a "file_path", in which case the
+    content is built once and served from the artifact cache.
+
+    Args:
+        artifact: A LangChain artifact dictionary
+        artifact_cache: The ArtifactCache for file-backed artifacts
+        artifact_budget: Optional ArtifactBudget bounding the artifact's size
+
+    Returns:
+        An MCP content object, or None for unsupported artifact types
+    """
+    if artifact["type"] == "image_url":
+        image_url = artifact["image_url"]
+        if "file_path" in image_url:
+            path = image_url["file_path"]
+            name = os.path.basename(path)
+            if artifact_budget is not None and not artifact_budget.file_fits(path):
+                return artifact_budget.oversized(name, _image_content, path=path)
+            return artifact_cache.get(
+                path,
+                lambda encoded: _image_content(_data_uri(path, encoded)),
+                variant="image",
+            )
+        if artifact_budget is not None:
+            return artifact_budget.inline("image", image_url["url"], _image_content)
+        return _image_content(image_url["url"])
+    elif artifact["type"] == "file":
+        file = artifact["file"]
+        file_name = file["filename"]
+
+        def build(file_data):
+            return _file_resource(file_name, file_data)
+
+        if "file_path" in file:
+            path = file["file_path"]
+            if artifact_budget is not None and not artifact_budget.file_fits(path):
+                return artifact_budget.oversized(file_name, build, path=path)
+            return artifact_cache.get(
+                path,
+                lambda encoded: build(_data_uri(path, encoded)),
+                variant=("file", file_name),
+            )
+        if artifact_budget is not None:
+            return artifact_budget.inline(file_name, file["file_data"], build)
+        return build(file["file_data"])
+    return None
+
+
+def handle_artifact_response(
+    func,
+    artifact_cache: ArtifactCache | None = None,
+    artifact_budget: "ArtifactBudget | None" = None,
+):
     """
     If langchain tool response_format=="content_and_artifact", then the tool
     returns a tuple of (text, artifacts), whereas MCP expects a dictionary
@@ -63,10 +343,16 @@ def handle_artifact_response(func):
 
     Args:
         func: A function that may return content_and_artifact format
+        artifact_cache: Cache for file-backed artifacts (defaults to a shared,
+            module-level cache)
+        artifact_budget: Optional ArtifactBudget bounding the memory held by
+            artifacts
 
     Returns:
         A function that converts LangChain artifact format to MCP format
     """
+    if artifact_cache is None:
+        artifact_cache = default_artifact_cache
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
@@ -82,26 +368,11 @@ def handle_artifact_response(func):
             response = [text]
 
             for artifact in artifacts:
-                if artifact["type"] == "image_url":
-                    file_data = artifact["image_url"]["url"]
-                    mime_type = _extract_mime_type(file_data)
-                    response.append(
-                        ImageContent(type="image", data=file_data, mimeType=mime_type)
-                    )
-                elif artifact["type"] == "file":
-                    file_data = artifact["file"]["file_data"]
-                    mime_type = _extract_mime_type(file_data)
-                    file_name = artifact["file"]["filename"]
-                    response.append(
-                        EmbeddedResource(
-                            type="resource",
-                            resource=BlobResourceContents(
-                                blob=file_name,
-                                uri=file_data,
-                                mimeType=mime_type,
-                            ),
-                        )
-                    )
+                content = _artifact_to_content(
+                    artifact, artifact_cache, artifact_budget
+                )
+                if content is not None:
+                    response.append(content)
 
             return tuple(response)
         else:
@@ -114,13 +385,61 @@ def handle_artifact_response(func):
     return wrapper
 
 
-def add_langchain_tool_to_server(server: FastMCP, tool: Tool):
+def add_langchain_tool_to_server(
+    server: "FastMCP",
+    tool: "BaseTool",
+    structured_output: bool | None = None,
+    artifact_cache: ArtifactCache | None = None,
+    resources: dict | None = None,
+    scheduler: "PriorityScheduler | None" = None,
+    priority: str = "normal",
+    tracing: "TracingPolicy | None" = None,
+    result_cache: "ResultCache | None" = None,
+    cache_version: str | None = None,
+    retry: "RetryPolicy | None" = None,
+    artifact_budget: "ArtifactBudget | None" = None,
+    warmup: bool | list = False,
+):
     """
     Adds a LangChain tool to a FastMCP server.
 
     Args:
         server: A FastMCP server instance
         tool: A LangChain Tool instance
+        structured_output: Whether to return results as MCP structured content,
+            with an output schema derived from the tool's return annotation.
+            If None, structured output is used when the annotation permits.
+            Ignored for tools with response_format="content_and_artifact".
+        artifact_cache: Cache for file-backed artifacts (defaults to a shared,
+            module-level cache)
+        resources: A mapping of the tool function's keyword arguments to
+            resource factories. Resources are created once when the server
+            starts, passed to every call and closed on shutdown; tools
+            declaring the same factory share one instance.
+            See ToolResources for the supported factories.
+        scheduler: A PriorityScheduler to run the tool's calls through. Clients
+            can override the priority class per request with a "priority"
+            key in the request's _meta.
+        priority: The tool's priority class when a scheduler is used
+        tracing: A TracingPolicy selecting calls (sampled, or slower than a
+            threshold) to report to LangChain callbacks and tracers. Without
+            it, calls bypass LangChain's callback machinery entirely.
+        result_cache: A ResultCache serving repeated calls with equal arguments
+            from disk. Only use it for tools with deterministic results.
+        cache_version: The tool version in the cache keys; change it when the
+            tool's results change (defaults to the "version" key of the
+            tool's metadata)
+        retry: A RetryPolicy retrying calls that fail with transient errors,
+            and optionally hedging slow calls. Only use it for idempotent tools.
+        artifact_budget: An ArtifactBudget bounding the size of the tool's
+            artifacts and the memory held by in-flight artifacts. Artifacts
+            over budget are spilled to files served as resources, truncated or
+            downsampled, according to its policy.
+        warmup: Whether to call the tool with sample inputs when the server
+            starts, before it handles requests. Either a list of argument
+            dictionaries, or True to use the "warmup_inputs" of the tool's
+            metadata or, failing that, arguments synthesized from its schema.
+            Only warm up tools without harmful side effects.
 
     Returns:
         None
@@ -129,8 +448,81 @@ def add_langchain_tool_to_server(server: FastMCP, tool: Tool):
     # First reconstruct the function from the LangChain tool
     func = reconstruct_func_from_tool(tool)
 
+    # Inject lifespan-managed resources
+    if resources:
+        tool_resources = get_tool_resources(server)
+        for factory in resources.values():
+            tool_resources.declare(factory)
+        func = inject_tool_resources(func, resources, tool_resources)
+
+    # The optional features are imported on first use, so servers not using
+    # them start without loading sqlite3 or LangChain's callbacks
+
+    # Time the tool itself for hedging, below the cache and inside any slot
+    if retry is not None:
+        from .retrying import time_tool_calls
+
+        func = time_tool_calls(func)
+
+    # Serve repeated calls from the persistent result cache
+    if result_cache is not None:
+        from .result_cache import cache_tool_results
+
+        if cache_version is None:
+            cache_version = (tool.metadata or {}).get("version")
+        func = cache_tool_results(func, tool, result_cache, cache_version)
+
+    # Report selected calls to LangChain callbacks
+    if tracing is not None:
+        from .tracing import trace_tool_calls
+
+        func = trace_tool_calls(func, tool, tracing)
+
     # Wrap it to handle artifact responses
-    func = handle_artifact_response(func)
+    if artifact_budget is not None:
+        from .artifact_budget import serve_spilled_artifacts
+
+        serve_spilled_artifacts(server, artifact_budget)
+    func = handle_artifact_response(func, artifact_cache, artifact_budget)
+
+    # Run calls in execution slots granted by priority
+    if scheduler is not None:
+        if priority not in scheduler.classes:
+            raise ValueError(f"Unknown priority class: {priority}")
+        func = schedule_tool_calls(func, server, scheduler, priority)
+
+    # Retry transient failures and hedge slow calls, off the event loop
+    if retry is not None:
+        from .retrying import retry_tool_calls
+
+        func = retry_tool_calls(func, retry)
+
+    # Artifact responses are content blocks, never structured content
+    if getattr(func, "response_format", None) == "content_and_artifact":
+        structured_output = False
 
     # Add the tool to the server
-    server.add_tool(func)
+    registered = server._tool_manager.add_tool(
+        func, structured_output=structured_output
+    )
+    metadata = registered.fn_metadata
+
+    # Serialize structured results in a single pass
+    if metadata.output_schema is not None:
+        metadata = StructuredOutputMetadata(**dict(metadata))
+
+    # Validate arguments once, against the tool's own args_schema
+    arg_model = compile_arg_model(tool.args_schema, frozenset(resources or ()))
+    if arg_model is not None:
+        metadata = metadata.model_copy(update={"arg_model": arg_model})
+        registered.parameters = arg_model.model_json_schema(by_alias=True)
+
+    registered.fn_metadata = metadata
+
+    # Exercise the tool at startup, before serving requests
+    if warmup:
+        from .warmup import get_tool_warmup, warmup_inputs
+
+        if warmup is True:
+            warmup = warmup_inputs(tool, registered.parameters)
+        get_tool_warmup(server).declare(registered.name, warmup)
@@ -0,0 +1,456 @@
+import base64
+import hashlib
+import hmac
+import importlib.util
+import io
+import mimetypes
+import os
+import re
+import secrets
+import shutil
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from mcp.types import ResourceLink, TextContent
+
+if TYPE_CHECKING:
+    from mcp.server import FastMCP
+
+DEFAULT_MAX_ARTIFACT_BYTES = 8 * 1024 * 1024
+DEFAULT_MAX_IN_FLIGHT_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_SPILL_BYTES = 1024 * 1024 * 1024
+DEFAULT_MAX_SPILLED_ARTIFACTS = 10000
+
+POLICIES = ("spill", "truncate", "downsample")
+SPILLED_URI_TEMPLATE = "artifact://spilled/{key}/{part}"
+
+_TEXT_TYPES = ("text/", "application/json", "application/xml")
+
+# Decode spilled base64 data 1 MiB at a time (a multiple of 4 characters)
+_DECODE_CHUNK = 4 * 256 * 1024
+
+
+class _BudgetState:
+    """In-flight accounting and spilled files shared by related budgets."""
+
+    def __init__(
+        self, max_in_flight_bytes, spill_directory, max_spill_bytes, max_spilled
+    ):
+        self.max_in_flight_bytes = max_in_flight_bytes
+        self.max_spill_bytes = max_spill_bytes
+        self.max_spilled = max_spilled
+        self.lock = threading.Lock()
+        self.in_flight_bytes = 0
+        self.spill_bytes = 0
+        # key -> (path, size, owned, part_bytes), least recently used first;
+        # owned files are deleted on eviction
+        self.spilled = OrderedDict()
+        # Keys of file-backed artifacts are derived from the file, so they
+        # can't be guessed from the path alone
+        self.secret = secrets.token_bytes(16)
+        self.stats = {
+            "admitted": 0,
+            "spilled": 0,
+            "truncated": 0,
+            "downsampled": 0,
+            "omitted": 0,
+            "peak_in_flight_bytes": 0,
+        }
+        self._spill_directory = spill_directory
+        self._finalizer = None
+
+    def spill_directory(self):
+        with self.lock:
+            if self._spill_directory is None:
+                self._spill_directory = tempfile.mkdtemp(prefix="mcp-artifacts-")
+                self._finalizer = weakref.finalize(
+                    self, shutil.rmtree, self._spill_directory, True
+                )
+            return self._spill_directory
+
+
+class ArtifactBudget:
+    """
+    Bounds the memory held by artifacts in tool responses.
+
+    Artifacts are admitted while they are at most max_artifact_bytes (as
+    base64 data) and the artifacts held by in-flight responses stay within
+    max_in_flight_bytes. Admitted artifacts are accounted until their MCP
+    content is released after the response is sent. Other artifacts are
+    handled according to the policy:
+
+    - "spill": the artifact is written to a temporary file (or, if it is
+      file-backed, left where it is) and returned as a resource link to its
+      first part, which clients read with resources/read. Parts are at most
+      max_artifact_bytes as base64 data; the link's meta holds the number of
+      parts
+    - "truncate": text artifacts are cut to fit; other artifacts are replaced
+      by a short notice
+    - "downsample": images are scaled down to fit (requires Pillow); other
+      artifacts are truncated
+
+    Budgets for individual tools are derived with for_tool(), sharing the
+    in-flight accounting and spilled files of this budget.
+    """
+
+    def __init__(
+        self,
+        max_artifact_bytes: int = DEFAULT_MAX_ARTIFACT_BYTES,
+        max_in_flight_bytes: int = DEFAULT_MAX_IN_FLIGHT_BYTES,
+        policy: str = "spill",
+        spill_directory: str | None = None,
+        max_spill_bytes: int = DEFAULT_MAX_SPILL_BYTES,
+        max_spilled_artifacts: int = DEFAULT_MAX_SPILLED_ARTIFACTS,
+    ):
+        _check_policy(policy)
+        self.max_artifact_bytes = max_artifact_bytes
+        self.policy = policy
+        self._state = _BudgetState(
+            max_in_flight_bytes,
+            spill_directory,
+            max_spill_bytes,
+            max_spilled_artifacts,
+        )
+
+    def for_tool(
+        self, max_artifact_bytes: int | None = None, policy: str | None = None
+    ):
+        """
+        Derives the budget of a tool, sharing this budget's in-flight limit.
+
+        Args:
+            max_artifact_bytes: The tool's limit per artifact
+            policy: The tool's policy for artifacts over budget
+
+        Returns:
+            An ArtifactBudget
+        """
+        budget = ArtifactBudget.__new__(ArtifactBudget)
+        budget.max_artifact_bytes = (
+            self.max_artifact_bytes
+            if max_artifact_bytes is None
+            else max_artifact_bytes
+        )
+        budget.policy = self.policy if policy is None else _check_policy(policy)
+        budget._state = self._state
+        return budget
+
+    @property
+    def in_flight_bytes(self):
+        """The bytes held by artifacts of in-flight responses."""
+        return self._state.in_flight_bytes
+
+    def stats(self):
+        """
+        Returns artifact budget statistics.
+
+        Returns:
+            A dictionary with the number of admitted, spilled, truncated,
+            downsampled and omitted artifacts, and the current and peak bytes
+            held by in-flight artifacts
+        """
+        state = self._state
+        with state.lock:
+            return {
+                **state.stats,
+                "in_flight_bytes": state.in_flight_bytes,
+                "spill_bytes": state.spill_bytes,
+            }
+
+    def file_fits(self, path):
+        """
+        Returns whether a file-backed artifact is within the per-artifact limit.
+
+        File-backed artifacts within the limit are served from the
+        ArtifactCache, which bounds their memory itself.
+
+        Args:
+            path: Path to the file backing the artifact
+        """
+        return _encoded_size(os.stat(path).st_size) <= self.max_artifact_bytes
+
+    def inline(self, name, data_uri, build):
+        """
+        Returns the MCP content of an inline artifact within the budget.
+
+        Args:
+            name: The artifact's file name
+            data_uri: The artifact's data URI
+            build: A callable building the MCP content from a data URI
+
+        Returns:
+            An MCP content object
+        """
+        size = len(data_uri)
+        if self._admit(size):
+            return self._track(build(data_uri), size)
+        return self.oversized(name, build, data_uri=data_uri)
+
+    def oversized(self, name, build, data_uri=None, path=None):
+        """
+        Applies the policy to an artifact over budget.
+
+        Args:
+            name: The artifact's file name
+            build: A callable building the MCP content from a data URI
+            data_uri: The artifact's data URI, for inline artifacts
+            path: Path to the file backing the artifact, for file artifacts
+
+        Returns:
+            An MCP content object
+        """
+        if data_uri is not None:
+            mime_type = _mime_type(data_uri)
+        else:
+            mime_type = mimetypes.guess_type(path)[0]
+        mime_type = mime_type or "application/octet-stream"
+
+        if self.policy == "spill":
+            return self._spill(name, mime_type, data_uri, path)
+
+        target = self._target_bytes()
+        if self.policy == "downsample" and mime_type.startswith("image/"):
+            data = _downsample(_read(data_uri, path), target)
+            if data is not None:
+                self._count("downsampled")
+                return self._encode(mime_type, data, build, downsampled=True)
+        elif mime_type.startswith(_TEXT_TYPES) and target > 0:
+            self._count("truncated")
+            return self._encode(mime_type, _read(data_uri, path, target), build)
+
+        self._count("omitted")
+        return TextContent(
+            type="text",
+            text=f"[Artifact {name!r} omitted: it exceeds the artifact budget]",
+        )
+
+    def spilled_path(self, key):
+        """
+        Returns the file of a spilled artifact, or None if unknown or evicted.
+
+        Args:
+            key: The key in the artifact's resource URI
+        """
+        entry = self._spilled_entry(key)
+        return entry[0] if entry is not None else None
+
+    def read_spilled(self, key, part):
+        """
+        Reads a part of a spilled artifact.
+
+        Only the part is read, so reads stay within the per-artifact limit of
+        the budget that spilled the artifact.
+
+        Args:
+            key: The key in the artifact's resource URI
+            part: The index of the part
+
+        Returns:
+            The part's bytes, or None if the artifact is unknown or evicted
+        """
+        entry = self._spilled_entry(key)
+        if entry is None:
+            return None
+        path, size, _, part_bytes = entry
+        if not 0 <= part < _parts(size, part_bytes):
+            raise ValueError(f"Artifact part {part} out of range")
+        with open(path, "rb") as file:
+            file.seek(part * part_bytes)
+            return file.read(part_bytes)
+
+    def _spilled_entry(self, key):
+        state = self._state
+        with state.lock:
+            entry = state.spilled.get(key)
+            if entry is not None:
+                state.spilled.move_to_end(key)
+            return entry
+
+    def _admit(self, size):
+        state = self._state
+        with state.lock:
+            fits = (
+                size <= self.max_artifact_bytes
+                and state.in_flight_bytes + size <= state.max_in_flight_bytes
+            )
+            if fits:
+                state.in_flight_bytes += size
+                state.stats["admitted"] += 1
+                state.stats["peak_in_flight_bytes"] = max(
+                    state.stats["peak_in_flight_bytes"], state.in_flight_bytes
+                )
+            return fits
+
+    def _track(self, content, size):
+        # Content objects are released once the response has been serialized
+        weakref.finalize(content, self._release, size)
+        return content
+
+    def _release(self, size):
+        with self._state.lock:
+            self._state.in_flight_bytes -= size
+
+    def _target_bytes(self):
+        state = self._state
+        with state.lock:
+            available = state.max_in_flight_bytes - state.in_flight_bytes
+        # Leave room for the data URI header and the base64 expansion
+        return max(0, (min(self.max_artifact_bytes, available) - 64) * 3 // 4)
+
+    def _encode(self, mime_type, data, build, downsampled=False):
+        data_uri = f"data:{mime_type};base64,{base64.b64encode(data).decode()}"
+        content = build(data_uri)
+        content.meta = {"downsampled" if downsampled else "truncated": True}
+        size = len(data_uri)
+        with self._state.lock:
+            self._state.in_flight_bytes += size
+        return self._track(content, size)
+
+    def _spill(self, name, mime_type, data_uri, path):
+        # Parts are served as base64 blobs within the per-artifact limit
+        part_bytes = max(3, self.max_artifact_bytes // 4 * 3)
+        if path is not None:
+            path = os.path.abspath(path)
+            stat = os.stat(path)
+            size = stat.st_size
+            # Repeated results of the same file share one entry
+            key = hmac.new(
+                self._state.secret,
+                f"{path}\0{stat.st_mtime_ns}\0{size}\0{part_bytes}".encode(),
+                hashlib.sha256,
+            ).hexdigest()[:32]
+            self._register(key, path, size, False, part_bytes)
+        else:
+            key = secrets.token_hex(16)
+            spill_path = os.path.join(self._state.spill_directory(), key)
+            payload = data_uri.partition(",")[2]
+            with open(spill_path, "wb") as file:
+                for start in range(0, len(payload), _DECODE_CHUNK):
+                    file.write(base64.b64decode(payload[start : start + _DECODE_CHUNK]))
+                size = file.tell()
+            self._register(key, spill_path, size, True, part_bytes)
+
+        self._count("spilled")
+        return ResourceLink(
+            type="resource_link",
+            name=name,
+            uri=SPILLED_URI_TEMPLATE.format(key=key, part=0),
+            mimeType=mime_type,
+            size=size,
+            _meta={"parts": _parts(size, part_bytes)},
+        )
+
+    def _register(self, key, path, size, owned, part_bytes):
+        state = self._state
+        evicted = []
+        with state.lock:
+            if key in state.spilled:
+                state.spilled.move_to_end(key)
+                return
+            state.spilled[key] = (path, size, owned, part_bytes)
+            if owned:
+                state.spill_bytes += size
+            while len(state.spilled) > 1 and (
+                len(state.spilled) > state.max_spilled
+                or state.spill_bytes > state.max_spill_bytes
+            ):
+                if len(state.spilled) > state.max_spilled:
+                    old_key = next(iter(state.spilled))
+                else:
+                    old_key = next(
+                        (k for k, entry in state.spilled.items() if entry[2]), None
+                    )
+                if old_key is None or old_key == key:
+                    break
+                old_path, old_size, old_owned, _ = state.spilled.pop(old_key)
+                if old_owned:
+                    state.spill_bytes -= old_size
+                    evicted.append(old_path)
+        for old_path in evicted:
+            try:
+                os.remove(old_path)
+            except FileNotFoundError:
+                pass
+
+    def _count(self, name):
+        with self._state.lock:
+            self._state.stats[name] += 1
+
+
+def serve_spilled_artifacts(server: "FastMCP", budget: ArtifactBudget):
+    """
+    Lets clients read a budget's spilled artifacts as server resources.
+
+    Args:
+        server: A FastMCP server instance
+        budget: The ArtifactBudget whose spilled artifacts to serve
+    """
+    budgets = getattr(server, "_artifact_budgets", None)
+    if budgets is None:
+        budgets = server._artifact_budgets = []
+
+        @server.resource(
+            SPILLED_URI_TEMPLATE,
+            name="spilled_artifact",
+            description="A part of an artifact too large to include in a tool result",
+            mime_type="application/octet-stream",
+        )
+        def read_spilled_artifact(key: str, part: int) -> bytes:
+            for candidate in budgets:
+                data = candidate.read_spilled(key, part)
+                if data is not None:
+                    return data
+            raise ValueError("Unknown or expired artifact")
+
+    if all(candidate._state is not budget._state for candidate in budgets):
+        budgets.append(budget)
+
+
+def _check_policy(policy):
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown artifact policy: {policy}")
+    if policy == "downsample" and importlib.util.find_spec("PIL") is None:
+        raise ValueError("The downsample policy requires the Pillow package")
+    return policy
+
+
+def _parts(size, part_bytes):
+    return max(1, -(-size // part_bytes))
+
+
+def _encoded_size(size):
+    return (size + 2) // 3 * 4
+
+
+def _mime_type(data_uri):
+    match = re.match(r"data:([^;]+);base64,", data_uri)
+    return match.group(1) if match else None
+
+
+def _read(data_uri, path, limit=None):
+    if path is not None:
+        with open(path, "rb") as file:
+            return file.read(-1 if limit is None else limit)
+    payload = data_uri.partition(",")[2]
+    if limit is not None:
+        payload = payload[: (limit + 2) // 3 * 4]
+    return base64.b64decode(payload)[:limit]
+
+
+def _downsample(data, target):
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(data))
+    image_format = image.format or "PNG"
+    scale = (target / max(len(data), 1)) ** 0.5
+    for _ in range(8):
+        size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+        output = io.BytesIO()
+        image.resize(size).save(output, format=image_format)
+        if output.tell() <= target:
+            return output.getvalue()
+        scale *= 0.7
+    return None
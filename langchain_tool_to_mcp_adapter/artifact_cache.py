@@ -0,0 +1,78 @@
+import base64
+import os
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class ArtifactCache:
+    """
+    A byte-bounded LRU cache of MCP content built from file-backed artifacts.
+
+    Entries are keyed by file path and revalidated against the file's
+    modification time and size, so a repeated lookup of an unchanged file costs
+    a single stat. The total size of the cached base64 payloads is bounded by
+    max_bytes, evicting the least recently used entries first.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path, build, variant=None):
+        """
+        Returns the content built from a file, building it on a cache miss.
+
+        Args:
+            path: Path to the file backing the artifact
+            build: A callable taking the base64 encoded file contents and
+                returning the MCP content object to cache
+            variant: Distinguishes different content built from the same file
+
+        Returns:
+            The cached (or freshly built) MCP content object
+        """
+        key = (path, variant)
+        stat = os.stat(path)
+        identity = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == identity:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        with open(path, "rb") as file:
+            encoded = base64.b64encode(file.read()).decode("ascii")
+        content = build(encoded)
+        size = len(encoded)
+
+        with self._lock:
+            self._discard(key)
+            if size <= self.max_bytes:
+                self._entries[key] = (identity, content, size)
+                self.current_bytes += size
+                while self.current_bytes > self.max_bytes:
+                    self._discard(next(iter(self._entries)))
+
+        return content
+
+    def clear(self):
+        """Removes all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry[2]
+
+
+default_artifact_cache = ArtifactCache()
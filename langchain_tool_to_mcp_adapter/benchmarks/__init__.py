@@ -0,0 +1,3 @@
+"""
+Benchmarks for langchain-tool-to-mcp-adapter.
+"""
@@ -0,0 +1,146 @@
+"""
+Response compression benchmark for langchain-tool-to-mcp-adapter.
+
+Builds tool results carrying base64 artifacts of increasing size, as produced
+by handle_artifact_response, and reports for each content encoding the
+compressed size, the compression and decompression times, and the resulting
+end-to-end latency over a link of the given bandwidth. Runs fully offline.
+
+Usage:
+    python -m langchain_tool_to_mcp_adapter.benchmarks.compression --bandwidth-mbps 20
+"""
+
+import argparse
+import base64
+import json
+import random
+import sys
+import time
+import zlib
+
+from ..compression import _create_compressor, available_encodings
+
+PAYLOAD_SIZES = (1024, 16 * 1024, 256 * 1024, 1024 * 1024, 8 * 1024 * 1024)
+
+
+def build_payload(size, seed=0):
+    """
+    Builds a JSON-RPC tool result carrying a base64 encoded artifact.
+
+    The artifact mixes repetitive text with random bytes, roughly like a PDF
+    with embedded images.
+
+    Args:
+        size: The approximate size of the artifact in bytes, before encoding
+        seed: Seed for the random part of the artifact
+
+    Returns:
+        The serialized response body
+    """
+    generator = random.Random(seed)
+    text = b"BT /F1 12 Tf 72 712 Td (A practical guide to building agents) Tj ET\n"
+    artifact = bytearray()
+    while len(artifact) < size:
+        artifact += text * 4
+        artifact += generator.randbytes(len(text) * 4)
+    encoded = base64.b64encode(bytes(artifact[:size])).decode("ascii")
+
+    result = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "result": {
+            "content": [
+                {"type": "text", "text": "Here is the requested document."},
+                {
+                    "type": "resource",
+                    "resource": {
+                        "uri": f"data:application/pdf;base64,{encoded}",
+                        "mimeType": "application/pdf",
+                        "blob": "guide.pdf",
+                    },
+                },
+            ]
+        },
+    }
+    return json.dumps(result).encode()
+
+
+def _decompress(encoding, data):
+    if encoding == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return zlib.decompress(data, 31)
+
+
+def measure(payload, encoding, bandwidth_mbps):
+    """
+    Measures the transfer of a payload with a content encoding.
+
+    Args:
+        payload: The response body
+        encoding: "identity", "gzip" or "zstd"
+        bandwidth_mbps: The link bandwidth in megabits per second
+
+    Returns:
+        A dictionary with the transferred size in bytes and the compression,
+        decompression, transfer and total latency in milliseconds
+    """
+    compress_seconds = decompress_seconds = 0.0
+    body = payload
+    if encoding != "identity":
+        start = time.perf_counter()
+        body = _create_compressor(encoding, 6 if encoding == "gzip" else 3).finish(
+            payload
+        )
+        compress_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        assert _decompress(encoding, body) == payload
+        decompress_seconds = time.perf_counter() - start
+
+    transfer_seconds = len(body) * 8 / (bandwidth_mbps * 1_000_000)
+    total_seconds = compress_seconds + transfer_seconds + decompress_seconds
+    return {
+        "bytes": len(body),
+        "compress_ms": compress_seconds * 1000,
+        "decompress_ms": decompress_seconds * 1000,
+        "transfer_ms": transfer_seconds * 1000,
+        "total_ms": total_seconds * 1000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bandwidth-mbps", type=float, default=20.0)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=PAYLOAD_SIZES,
+        help="Artifact sizes in bytes",
+    )
+    args = parser.parse_args(argv)
+
+    # Load the compression libraries before timing anything
+    for encoding in available_encodings():
+        measure(b"warmup", encoding, args.bandwidth_mbps)
+
+    print(
+        f"{'artifact':>10} {'encoding':>9} {'bytes':>10} {'compress':>9} "
+        f"{'transfer':>9} {'decompress':>10} {'total':>9}"
+    )
+    for size in args.sizes:
+        payload = build_payload(size)
+        for encoding in ("identity",) + available_encodings():
+            result = measure(payload, encoding, args.bandwidth_mbps)
+            print(
+                f"{size:>10} {encoding:>9} {result['bytes']:>10} "
+                f"{result['compress_ms']:>7.1f}ms {result['transfer_ms']:>7.1f}ms "
+                f"{result['decompress_ms']:>8.1f}ms {result['total_ms']:>7.1f}ms"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
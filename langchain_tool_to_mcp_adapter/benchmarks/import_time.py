@@ -0,0 +1,125 @@
+"""
+Import-time benchmark for langchain-tool-to-mcp-adapter.
+
+Measures, in fresh interpreters, how long it takes to import the package, to
+import the adapter module and to cold-start a server (import FastMCP, build a
+LangChain tool and register it), which dominates the spawn time of short-lived
+stdio servers. Fails if the package or adapter import exceeds its budget or
+loads heavy dependencies.
+
+Usage:
+    python -m langchain_tool_to_mcp_adapter.benchmarks.import_time \\
+        --budget-ms 50 --adapter-budget-ms 1000
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("langchain", "langchain_core", "mcp", "pydantic")
+
+# Modules only needed by optional features, which the adapter imports on use
+ADAPTER_HEAVY_MODULES = ("langchain_core.callbacks", "langsmith", "sqlite3")
+
+PACKAGE_IMPORT = "import langchain_tool_to_mcp_adapter"
+
+ADAPTER_IMPORT = "import langchain_tool_to_mcp_adapter.adapter"
+
+SERVER_STARTUP = '''
+from mcp.server import FastMCP
+from langchain_core.tools import StructuredTool
+from langchain_tool_to_mcp_adapter import add_langchain_tool_to_server
+
+def echo(text: str) -> str:
+    """Echo the input."""
+    return text
+
+add_langchain_tool_to_server(FastMCP(), StructuredTool.from_function(echo))
+'''
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+exec(compile({code!r}, "<benchmark>", "exec"))
+elapsed = time.perf_counter() - start
+print(elapsed, ",".join(sorted(sys.modules)))
+"""
+
+
+def measure(code, runs=5):
+    """
+    Measures the time taken to run code in fresh interpreters.
+
+    Args:
+        code: The Python source to run
+        runs: The number of interpreters to spawn
+
+    Returns:
+        A tuple of the median time in seconds and the set of modules loaded by
+        the code
+    """
+    timings = []
+    modules = set()
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(code=code)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        timings.append(float(output[0]))
+        modules = set(output[1].split(","))
+    return statistics.median(timings), modules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=50.0,
+        help="Maximum median time to import the package",
+    )
+    parser.add_argument(
+        "--adapter-budget-ms",
+        type=float,
+        default=1000.0,
+        help="Maximum median time to import the adapter module",
+    )
+    args = parser.parse_args(argv)
+
+    import_seconds, modules = measure(PACKAGE_IMPORT, args.runs)
+    adapter_seconds, adapter_modules = measure(ADAPTER_IMPORT, args.runs)
+    startup_seconds, _ = measure(SERVER_STARTUP, args.runs)
+
+    print(f"package import: {import_seconds * 1000:.1f} ms")
+    print(f"adapter import: {adapter_seconds * 1000:.1f} ms")
+    print(f"server startup: {startup_seconds * 1000:.1f} ms")
+
+    failures = []
+    checks = (
+        ("package", modules, HEAVY_MODULES, import_seconds, args.budget_ms),
+        (
+            "adapter",
+            adapter_modules,
+            ADAPTER_HEAVY_MODULES,
+            adapter_seconds,
+            args.adapter_budget_ms,
+        ),
+    )
+    for name, loaded, heavy_modules, seconds, budget_ms in checks:
+        heavy = sorted(loaded.intersection(heavy_modules))
+        if heavy:
+            failures.append(f"{name} import loaded {', '.join(heavy)}")
+        if seconds * 1000 > budget_ms:
+            failures.append(f"{name} import exceeded {budget_ms:.1f} ms budget")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,364 @@
+"""
+Load-testing harness for servers built with add_langchain_tool_to_server.
+
+Starts a server with the langchain-to-mcp launcher over stdio or a local
+HTTP port, drives it with concurrent simulated MCP clients calling a weighted
+mix of tools, and reports throughput, latency percentiles, error rates and the
+server's RSS over time. Runs fully offline.
+
+Usage:
+    python -m langchain_tool_to_mcp_adapter.benchmarks.load_test \\
+        --transport streamable-http --clients 16 --duration 30 \\
+        --mix echo:8 sleep:1 artifact:1 --artifact-size 1048576
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shlex
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import AsyncExitStack
+
+DEFAULT_TOOLS = "langchain_tool_to_mcp_adapter.benchmarks.load_tools"
+DEFAULT_MIX = ("echo:8", "sleep:1", "artifact:1")
+DEFAULT_ARGUMENTS = {
+    "echo": {"text": "hello"},
+    "sleep": {"milliseconds": 20},
+    "artifact": {"size": 64 * 1024},
+}
+
+
+def parse_mix(entries, artifact_size=None):
+    """
+    Parses a tool mix.
+
+    Args:
+        entries: Entries of the form "name:weight" or "name:weight:json-args".
+            Without arguments, the built-in load-test tools get defaults.
+        artifact_size: Overrides the size argument of the artifact tool
+
+    Returns:
+        A list of (tool name, weight, arguments) tuples
+    """
+    mix = []
+    for entry in entries:
+        name, _, rest = entry.partition(":")
+        weight, _, arguments = rest.partition(":")
+        if arguments:
+            arguments = json.loads(arguments)
+        else:
+            arguments = dict(DEFAULT_ARGUMENTS.get(name, {}))
+        if name == "artifact" and artifact_size is not None:
+            arguments["size"] = artifact_size
+        mix.append((name, float(weight or 1), arguments))
+    return mix
+
+
+def percentile(values, fraction):
+    """
+    Returns the nearest-rank percentile of some values.
+
+    Args:
+        values: The values
+        fraction: The percentile, between 0 and 1
+
+    Returns:
+        The percentile, or None if there are no values
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def read_rss(pid):
+    """
+    Returns the resident set size of a process in bytes, or None if unknown.
+
+    Args:
+        pid: The process id
+    """
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import psutil
+
+        return psutil.Process(pid).memory_info().rss
+    except Exception:
+        return None
+
+
+def _server_command(args, ready_file):
+    command = [sys.executable, "-m", "langchain_tool_to_mcp_adapter.cli", "serve"]
+    command += args.tools
+    command += ["--transport", args.transport, "--ready-file", ready_file]
+    if args.transport != "stdio":
+        command += ["--port", str(args.port)]
+    return command + shlex.split(args.server_args)
+
+
+async def _wait_until_ready(ready_file, port=None, process=None, timeout=60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError("The server exited before becoming ready")
+        if os.path.exists(ready_file):
+            if port is None:
+                return
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                return
+            except OSError:
+                pass
+        await asyncio.sleep(0.05)
+    raise TimeoutError("The server did not become ready in time")
+
+
+async def _open_sessions(args, stack, ready_file):
+    from mcp import ClientSession, StdioServerParameters
+
+    command = _server_command(args, ready_file)
+
+    if args.transport == "stdio":
+        from mcp.client.stdio import stdio_client
+
+        devnull = stack.enter_context(open(os.devnull, "w"))
+        parameters = StdioServerParameters(command=command[0], args=command[1:])
+        read, write = await stack.enter_async_context(
+            stdio_client(parameters, errlog=devnull)
+        )
+        session = await stack.enter_async_context(ClientSession(read, write))
+        await session.initialize()
+        await _wait_until_ready(ready_file)
+        # A stdio server has a single session, shared by all simulated clients
+        return [session] * args.clients
+
+    process = subprocess.Popen(
+        command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    stack.callback(process.wait)
+    stack.callback(process.terminate)
+    await _wait_until_ready(ready_file, args.port, process)
+
+    if args.transport == "sse":
+        from mcp.client.sse import sse_client
+
+        def connect():
+            return sse_client(f"http://127.0.0.1:{args.port}/sse")
+
+    else:
+        from mcp.client.streamable_http import streamablehttp_client
+
+        def connect():
+            return streamablehttp_client(f"http://127.0.0.1:{args.port}/mcp")
+
+    sessions = []
+    for _ in range(args.clients):
+        streams = await stack.enter_async_context(connect())
+        session = await stack.enter_async_context(ClientSession(*streams[:2]))
+        await session.initialize()
+        sessions.append(session)
+    return sessions
+
+
+async def _client(session, mix, deadline, seed, samples):
+    generator = random.Random(seed)
+    names = [name for name, _, _ in mix]
+    weights = [weight for _, weight, _ in mix]
+    arguments = {name: tool_arguments for name, _, tool_arguments in mix}
+
+    while time.monotonic() < deadline:
+        name = generator.choices(names, weights)[0]
+        started = time.perf_counter()
+        try:
+            result = await session.call_tool(name, arguments[name])
+            error = bool(result.isError)
+        except Exception:
+            error = True
+        samples.append((name, time.perf_counter() - started, error))
+
+
+async def _sample_rss(pid, interval, started, rss):
+    while True:
+        rss.append((time.monotonic() - started, read_rss(pid)))
+        await asyncio.sleep(interval)
+
+
+async def run_load_test(args):
+    """
+    Runs a load test.
+
+    Args:
+        args: The parsed command line arguments
+
+    Returns:
+        A report dictionary, see summarize()
+    """
+    mix = parse_mix(args.mix, args.artifact_size)
+    samples = []
+    rss = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        ready_file = os.path.join(directory, "ready")
+        async with AsyncExitStack() as stack:
+            sessions = await _open_sessions(args, stack, ready_file)
+            with open(ready_file) as file:
+                pid = int(file.read())
+
+            started = time.monotonic()
+            sampler = asyncio.create_task(
+                _sample_rss(pid, args.rss_interval, started, rss)
+            )
+            deadline = started + args.duration
+            await asyncio.gather(
+                *(
+                    _client(session, mix, deadline, args.seed + index, samples)
+                    for index, session in enumerate(sessions)
+                )
+            )
+            elapsed = time.monotonic() - started
+            sampler.cancel()
+            rss.append((elapsed, read_rss(pid)))
+
+    return summarize(args, samples, elapsed, rss)
+
+
+def _latencies(samples):
+    latencies = [latency * 1000 for _, latency, _ in samples]
+    return {
+        "p50": percentile(latencies, 0.50),
+        "p95": percentile(latencies, 0.95),
+        "p99": percentile(latencies, 0.99),
+    }
+
+
+def summarize(args, samples, elapsed, rss):
+    """
+    Summarizes the samples of a load test.
+
+    Args:
+        args: The parsed command line arguments
+        samples: (tool name, latency in seconds, error) tuples
+        elapsed: The duration of the test in seconds
+        rss: (seconds since start, RSS in bytes) tuples
+
+    Returns:
+        A report dictionary with the request count, throughput, error rate and
+        latency percentiles (in milliseconds), overall and per tool, and the
+        server's RSS over time (in MiB)
+    """
+    errors = sum(error for _, _, error in samples)
+    tools = {}
+    for name in sorted({name for name, _, _ in samples}):
+        tool_samples = [sample for sample in samples if sample[0] == name]
+        tool_errors = sum(error for _, _, error in tool_samples)
+        tools[name] = {
+            "requests": len(tool_samples),
+            "errors": tool_errors,
+            "latency_ms": _latencies(tool_samples),
+        }
+
+    return {
+        "transport": args.transport,
+        "clients": args.clients,
+        "duration_s": elapsed,
+        "requests": len(samples),
+        "throughput_rps": len(samples) / elapsed if elapsed else 0.0,
+        "errors": errors,
+        "error_rate": errors / len(samples) if samples else 0.0,
+        "latency_ms": _latencies(samples),
+        "tools": tools,
+        "rss_mib": [
+            (round(seconds, 2), None if size is None else size / 2**20)
+            for seconds, size in rss
+        ],
+    }
+
+
+def format_report(report):
+    """Formats a load test report as text."""
+
+    def latency(values):
+        return "  ".join(
+            f"{name} {'-' if value is None else f'{value:.1f}'}ms"
+            for name, value in values.items()
+        )
+
+    lines = [
+        f"transport: {report['transport']}, clients: {report['clients']}, "
+        f"duration: {report['duration_s']:.1f}s",
+        f"requests: {report['requests']}  "
+        f"throughput: {report['throughput_rps']:.1f} req/s  "
+        f"errors: {report['errors']} ({report['error_rate']:.2%})",
+        f"latency: {latency(report['latency_ms'])}",
+    ]
+    for name, tool in report["tools"].items():
+        lines.append(
+            f"  {name}: {tool['requests']} requests, {tool['errors']} errors, "
+            f"{latency(tool['latency_ms'])}"
+        )
+    lines.append("server RSS:")
+    for seconds, size in report["rss_mib"]:
+        lines.append(
+            f"  {seconds:>7.1f}s  {'-' if size is None else f'{size:.1f}'} MiB"
+        )
+    return "\n".join(lines)
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--transport",
+        choices=("stdio", "sse", "streamable-http"),
+        default="stdio",
+    )
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds")
+    parser.add_argument(
+        "--mix",
+        nargs="+",
+        default=list(DEFAULT_MIX),
+        help='Weighted tool calls, as "name:weight" or "name:weight:json-args"',
+    )
+    parser.add_argument(
+        "--artifact-size", type=int, default=None, help="Bytes per artifact"
+    )
+    parser.add_argument(
+        "--tools",
+        nargs="+",
+        default=[DEFAULT_TOOLS],
+        help="Tool specs to serve (see langchain-to-mcp serve)",
+    )
+    parser.add_argument(
+        "--server-args",
+        default="",
+        help='Extra langchain-to-mcp serve options, e.g. "--slots 8"',
+    )
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rss-interval", type=float, default=1.0, help="Seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print a JSON report")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    report = asyncio.run(run_load_test(args))
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
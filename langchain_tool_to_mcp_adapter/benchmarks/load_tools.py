@@ -0,0 +1,45 @@
+"""
+Tools served by the load-test harness.
+
+Serve them with:
+    langchain-to-mcp serve langchain_tool_to_mcp_adapter.benchmarks.load_tools
+"""
+
+import base64
+import os
+import time
+
+from langchain_core.tools import StructuredTool
+
+
+def echo(text: str) -> str:
+    """Return the input text."""
+    return text
+
+
+def sleep(milliseconds: int) -> str:
+    """Sleep for the given number of milliseconds, like a slow downstream call."""
+    time.sleep(milliseconds / 1000)
+    return f"Slept {milliseconds} ms"
+
+
+def artifact(size: int) -> tuple:
+    """Return a binary artifact of the given size in bytes."""
+    encoded = base64.b64encode(os.urandom(size)).decode("ascii")
+    artifacts = [
+        {
+            "type": "file",
+            "file": {
+                "filename": "artifact.bin",
+                "file_data": f"data:application/octet-stream;base64,{encoded}",
+            },
+        }
+    ]
+    return f"Generated a {size} byte artifact", artifacts
+
+
+echo_tool = StructuredTool.from_function(echo)
+sleep_tool = StructuredTool.from_function(sleep)
+artifact_tool = StructuredTool.from_function(
+    artifact, response_format="content_and_artifact"
+)
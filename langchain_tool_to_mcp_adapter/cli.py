@@ -0,0 +1,404 @@
+"""
+Command line launcher for serving LangChain tools over MCP.
+
+Usage:
+    langchain-to-mcp serve pkg.module:tools [--transport stdio] [--uvloop] ...
+"""
+
+import argparse
+import functools
+import importlib
+import importlib.util
+import logging
+import os
+import sys
+
+from .resources import get_tool_resources
+from .warmup import get_tool_warmup
+
+logger = logging.getLogger(__name__)
+
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+def load_tools(spec):
+    """
+    Loads LangChain tools from an import spec.
+
+    Args:
+        spec: Either "pkg.module:attribute", where the attribute is a tool, an
+            iterable of tools, or a callable returning either, or "pkg.module",
+            in which case every tool defined at module level is loaded
+
+    Returns:
+        A list of LangChain tools
+
+    Raises:
+        ValueError: If the spec does not resolve to any tools
+    """
+    from langchain_core.tools import BaseTool
+
+    module_name, _, attribute = spec.partition(":")
+    module = importlib.import_module(module_name)
+
+    if not attribute:
+        tools = [
+            value for value in vars(module).values() if isinstance(value, BaseTool)
+        ]
+    else:
+        target = functools.reduce(getattr, attribute.split("."), module)
+        if callable(target) and not isinstance(target, BaseTool):
+            target = target()
+        tools = [target] if isinstance(target, BaseTool) else list(target)
+
+    if not tools or not all(isinstance(tool, BaseTool) for tool in tools):
+        raise ValueError(f"{spec!r} does not resolve to LangChain tools")
+    return tools
+
+
+def build_server(tools, args):
+    """
+    Builds a FastMCP server and registers the tools with it.
+
+    Args:
+        tools: The LangChain tools to serve
+        args: The parsed command line arguments
+
+    Returns:
+        A FastMCP server instance
+
+    Raises:
+        ValueError: If --cache-tool or --warmup names a tool that is not loaded
+    """
+    from mcp.server import FastMCP
+
+    from .adapter import add_langchain_tool_to_server
+    from .artifact_budget import ArtifactBudget
+    from .result_cache import ResultCache
+    from .scheduling import PriorityScheduler
+    from .tracing import TracingPolicy
+
+    names = {tool.name for tool in tools}
+    for option, selected in (
+        ("--cache-tool", args.cache_tool),
+        ("--warmup", args.warmup),
+    ):
+        unknown = sorted(set(selected) - names)
+        if unknown:
+            raise ValueError(
+                f"{option} names unknown tools: {', '.join(unknown)} "
+                f"(loaded: {', '.join(sorted(names))})"
+            )
+
+    server = FastMCP(
+        name=args.name,
+        log_level=args.log_level,
+        host=args.host,
+        port=args.port,
+    )
+    scheduler = PriorityScheduler(slots=args.slots) if args.slots else None
+    tracing = None
+    if args.trace_sample_rate or args.trace_latency_ms is not None:
+        tracing = TracingPolicy(
+            sample_rate=args.trace_sample_rate,
+            latency_threshold=(
+                args.trace_latency_ms / 1000
+                if args.trace_latency_ms is not None
+                else None
+            ),
+        )
+
+    result_cache = None
+    if args.result_cache:
+        result_cache = ResultCache(
+            args.result_cache, max_bytes=args.result_cache_mb * 1024 * 1024
+        )
+
+    artifact_budget = None
+    if args.max_artifact_mb is not None or args.max_in_flight_artifact_mb is not None:
+        limits = {}
+        if args.max_artifact_mb is not None:
+            limits["max_artifact_bytes"] = int(args.max_artifact_mb * 2**20)
+        if args.max_in_flight_artifact_mb is not None:
+            limits["max_in_flight_bytes"] = int(args.max_in_flight_artifact_mb * 2**20)
+        artifact_budget = ArtifactBudget(policy=args.artifact_policy, **limits)
+
+    for tool in tools:
+        add_langchain_tool_to_server(
+            server,
+            tool,
+            scheduler=scheduler,
+            tracing=tracing,
+            result_cache=result_cache if tool.name in args.cache_tool else None,
+            artifact_budget=artifact_budget,
+            warmup=tool.name in args.warmup,
+        )
+    return server
+
+
+def signal_ready(ready_file):
+    """
+    Signals that the server is ready to accept requests.
+
+    Args:
+        ready_file: Optional path of a file to create, containing the process id
+    """
+    logger.info("Server ready")
+    if ready_file:
+        temporary_file = f"{ready_file}.tmp"
+        with open(temporary_file, "w") as file:
+            file.write(str(os.getpid()))
+        os.replace(temporary_file, ready_file)
+
+
+def clear_ready(ready_file):
+    """
+    Withdraws the readiness signal when the server shuts down.
+
+    Args:
+        ready_file: Optional path of the ready file to remove
+    """
+    if ready_file:
+        try:
+            os.remove(ready_file)
+        except FileNotFoundError:
+            pass
+
+
+async def serve(server, args):
+    """
+    Runs the server until it is shut down.
+
+    Tool resources are opened once up front, so they are shared by every
+    session rather than created per connection on HTTP transports. With
+    --warmup, the tools are warmed up before readiness is signaled. On HTTP
+    transports, readiness is signaled once uvicorn listens on its port. The
+    ready file is removed on shutdown.
+
+    Args:
+        server: A FastMCP server instance
+        args: The parsed command line arguments
+    """
+    import anyio.to_thread
+
+    if args.threads:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = args.threads
+
+    async with get_tool_resources(server):
+        if args.warmup:
+            warmup = get_tool_warmup(server)
+            warmup.parallel = args.warmup_parallel
+            await warmup.run(server)
+        try:
+            if args.transport == "stdio":
+                signal_ready(args.ready_file)
+                await server.run_stdio_async()
+            else:
+                await _serve_http(server, args)
+        finally:
+            clear_ready(args.ready_file)
+
+
+async def _serve_http(server, args):
+    import uvicorn
+
+    from .compression import compressed_app
+
+    if args.no_compression:
+        app = (
+            server.sse_app()
+            if args.transport == "sse"
+            else server.streamable_http_app()
+        )
+    else:
+        app = compressed_app(
+            server, args.transport, minimum_size=args.compression_threshold
+        )
+
+    class ReadyServer(uvicorn.Server):
+        async def startup(self, sockets=None):
+            await super().startup(sockets=sockets)
+            # Not started if the port could not be bound
+            if self.started:
+                signal_ready(args.ready_file)
+
+        async def shutdown(self, sockets=None):
+            clear_ready(args.ready_file)
+            await super().shutdown(sockets=sockets)
+
+    config = uvicorn.Config(
+        app,
+        host=server.settings.host,
+        port=server.settings.port,
+        log_level=server.settings.log_level.lower(),
+    )
+    await ReadyServer(config).serve()
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="langchain-to-mcp", description="Serve LangChain tools over MCP."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="Serve LangChain tools")
+    serve_parser.add_argument(
+        "tools",
+        nargs="+",
+        help='Tools to serve, as "pkg.module:attribute" or "pkg.module"',
+    )
+    serve_parser.add_argument("--name", default=None, help="Server name")
+    serve_parser.add_argument(
+        "--transport",
+        choices=("stdio", "sse", "streamable-http"),
+        default="stdio",
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8000)
+    serve_parser.add_argument(
+        "--compression-threshold",
+        type=int,
+        default=1024,
+        metavar="BYTES",
+        help="Compress HTTP responses of at least this size (gzip/zstd)",
+    )
+    serve_parser.add_argument(
+        "--no-compression",
+        action="store_true",
+        help="Disable HTTP response compression",
+    )
+    serve_parser.add_argument(
+        "--log-level", choices=LOG_LEVELS, default="WARNING", type=str.upper
+    )
+    serve_parser.add_argument(
+        "--uvloop", action="store_true", help="Run on the uvloop event loop"
+    )
+    serve_parser.add_argument(
+        "--slots",
+        type=int,
+        default=0,
+        help="Run tool calls in worker threads, at most this many at a time "
+        "(default: run tools on the event loop)",
+    )
+    serve_parser.add_argument(
+        "--threads", type=int, default=0, help="Size of the worker thread pool"
+    )
+    serve_parser.add_argument(
+        "--trace-sample-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of tool calls to report to LangChain callbacks/tracers",
+    )
+    serve_parser.add_argument(
+        "--trace-latency-ms",
+        type=float,
+        default=None,
+        help="Report tool calls slower than this to LangChain callbacks/tracers",
+    )
+    serve_parser.add_argument(
+        "--result-cache",
+        default=None,
+        metavar="DIRECTORY",
+        help="Cache the results of the --cache-tool tools in this directory, "
+        "shared by processes on this host",
+    )
+    serve_parser.add_argument(
+        "--result-cache-mb",
+        type=int,
+        default=256,
+        help="Size limit of the result cache in MiB",
+    )
+    serve_parser.add_argument(
+        "--cache-tool",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="Serve this deterministic tool's results from the result cache "
+        "(repeatable)",
+    )
+    serve_parser.add_argument(
+        "--max-artifact-mb",
+        type=float,
+        default=None,
+        help="Apply the artifact policy to artifacts larger than this",
+    )
+    serve_parser.add_argument(
+        "--max-in-flight-artifact-mb",
+        type=float,
+        default=None,
+        help="Bound the memory held by artifacts of in-flight responses",
+    )
+    serve_parser.add_argument(
+        "--artifact-policy",
+        choices=("spill", "truncate", "downsample"),
+        default="spill",
+        help="What to do with artifacts over budget (default: spill to files "
+        "served as resources)",
+    )
+    serve_parser.add_argument(
+        "--warmup",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="Call this tool with sample inputs (its metadata's warmup_inputs, "
+        "or arguments synthesized from its schema) before signaling readiness "
+        "(repeatable)",
+    )
+    serve_parser.add_argument(
+        "--warmup-parallel",
+        action="store_true",
+        help="Warm up the tools concurrently",
+    )
+    serve_parser.add_argument(
+        "--preload",
+        action="append",
+        default=[],
+        metavar="MODULE",
+        help="Import a module before serving (repeatable)",
+    )
+    serve_parser.add_argument(
+        "--ready-file",
+        default=None,
+        help="Create this file (containing the process id) once ready",
+    )
+
+    args = parser.parse_args(argv)
+    if args.uvloop and importlib.util.find_spec("uvloop") is None:
+        parser.error("--uvloop requires the uvloop package")
+    if args.cache_tool and not args.result_cache:
+        parser.error("--cache-tool requires --result-cache")
+    return args
+
+
+def main(argv=None):
+    """Entry point of the langchain-to-mcp command."""
+    import anyio
+
+    args = _parse_args(argv)
+    logging.basicConfig(level=args.log_level)
+
+    # Make tools importable from the current directory, like `python -m`
+    sys.path.insert(0, os.getcwd())
+
+    for module_name in args.preload:
+        importlib.import_module(module_name)
+
+    tools = [tool for spec in args.tools for tool in load_tools(spec)]
+    try:
+        server = build_server(tools, args)
+    except ValueError as error:
+        # Reported like the argument errors of _parse_args
+        print(f"langchain-to-mcp: error: {error}", file=sys.stderr)
+        return 2
+
+    anyio.run(
+        serve,
+        server,
+        args,
+        backend_options={"use_uvloop": args.uvloop},
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+import asyncio
+import importlib.util
+import zlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mcp.server import FastMCP
+
+DEFAULT_MINIMUM_SIZE = 1024
+DEFAULT_FLUSH_DELAY = 0.01
+
+_COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+)
+
+
+class _GzipCompressor:
+    def __init__(self, level):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data):
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self, data=b""):
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class _ZstdCompressor:
+    def __init__(self, level):
+        import zstandard
+
+        self._flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data):
+        return self._compressor.compress(data) + self._compressor.flush(
+            self._flush_block
+        )
+
+    def finish(self, data=b""):
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+def available_encodings():
+    """
+    Returns the content encodings supported in this environment.
+
+    Returns:
+        A tuple of encodings, most preferred first. zstd requires the optional
+        zstandard package.
+    """
+    if importlib.util.find_spec("zstandard") is not None:
+        return ("zstd", "gzip")
+    return ("gzip",)
+
+
+def negotiate_encoding(accept_encoding, encodings):
+    """
+    Picks the content encoding for a response.
+
+    Args:
+        accept_encoding: The request's Accept-Encoding header value
+        encodings: The encodings the server supports, most preferred first
+
+    Returns:
+        The first supported encoding the client accepts, or None
+    """
+    accepted = set()
+    for item in accept_encoding.split(","):
+        name, _, parameters = item.strip().partition(";")
+        quality = parameters.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(name.strip().lower())
+
+    for encoding in encodings:
+        if encoding in accepted or "*" in accepted:
+            return encoding
+    return None
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing HTTP responses with gzip or zstd, negotiated
+    from the request's Accept-Encoding header.
+
+    Responses smaller than minimum_size are sent uncompressed, since
+    compressing them costs more than it saves. Streamed responses (such as the
+    SSE streams carrying tool results) are held back until they reach
+    minimum_size or end, then compressed incrementally, flushing after every
+    chunk so events are delivered without delay. A stream that pauses for
+    flush_delay seconds before reaching minimum_size is long-lived (e.g. an SSE
+    stream waiting for requests), so it is compressed from then on.
+    """
+
+    def __init__(
+        self,
+        app,
+        minimum_size: int = DEFAULT_MINIMUM_SIZE,
+        encodings: tuple | None = None,
+        gzip_level: int = 6,
+        zstd_level: int = 3,
+        flush_delay: float = DEFAULT_FLUSH_DELAY,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.flush_delay = flush_delay
+        self.encodings = tuple(encodings or available_encodings())
+        self._levels = {"gzip": gzip_level, "zstd": zstd_level}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        accept_encoding = headers.get(b"accept-encoding", b"").decode("latin-1")
+        encoding = negotiate_encoding(accept_encoding, self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingResponder(
+            send,
+            encoding,
+            self._levels[encoding],
+            self.minimum_size,
+            self.flush_delay,
+        )
+        try:
+            await self.app(scope, receive, responder.send)
+        finally:
+            responder.close()
+
+
+class _CompressingResponder:
+    def __init__(self, send, encoding, level, minimum_size, flush_delay):
+        self._send = send
+        self._encoding = encoding
+        self._level = level
+        self._minimum_size = minimum_size
+        self._flush_delay = flush_delay
+        self._lock = asyncio.Lock()
+        self._start = None
+        # Body chunks held back until the encoding is decided
+        self._held = []
+        self._held_size = 0
+        self._timer = None
+        self._compressor = None
+        self._passthrough = False
+
+    async def send(self, message):
+        async with self._lock:
+            await self._forward(message)
+
+    def close(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    async def _forward(self, message):
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+
+        if self._start is not None:
+            if message["type"] != "http.response.body":
+                # Forwarded after the start it belongs to
+                await self._commit(compress=False)
+                await self._send(message)
+                return
+            if not _is_compressible(self._start["headers"]):
+                await self._commit(compress=False)
+                await self._send(message)
+                return
+
+            self._held.append(message)
+            self._held_size += len(message.get("body", b""))
+            if not message.get("more_body", False):
+                await self._commit(compress=self._held_size >= self._minimum_size)
+            elif self._held_size >= self._minimum_size:
+                await self._commit(compress=True)
+            elif self._timer is None:
+                self._timer = asyncio.get_running_loop().call_later(
+                    self._flush_delay, self._schedule_flush
+                )
+            return
+
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        await self._send({**message, "body": self._compress(message)})
+
+    def _schedule_flush(self):
+        self._timer = asyncio.ensure_future(self._flush())
+
+    async def _flush(self):
+        async with self._lock:
+            self._timer = None
+            if self._start is not None:
+                await self._commit(compress=True)
+
+    async def _commit(self, compress):
+        self.close()
+        start, self._start = self._start, None
+        held, self._held, self._held_size = self._held, [], 0
+
+        if not compress:
+            self._passthrough = True
+            await self._send(start)
+            for message in held:
+                await self._send(message)
+            return
+
+        self._compressor = _create_compressor(self._encoding, self._level)
+        headers = [
+            (name, value)
+            for name, value in start["headers"]
+            if name.lower() != b"content-length"
+        ]
+        headers.append((b"content-encoding", self._encoding.encode()))
+        headers.append((b"vary", b"accept-encoding"))
+        message = {
+            **held[-1],
+            "body": b"".join(message.get("body", b"") for message in held),
+        }
+        body = self._compress(message)
+        if not message.get("more_body", False):
+            headers.append((b"content-length", str(len(body)).encode()))
+        await self._send({**start, "headers": headers})
+        await self._send({**message, "body": body})
+
+    def _compress(self, message):
+        body = message.get("body", b"")
+        if message.get("more_body", False):
+            return self._compressor.compress(body)
+        return self._compressor.finish(body)
+
+
+def _create_compressor(encoding, level):
+    if encoding == "zstd":
+        return _ZstdCompressor(level)
+    return _GzipCompressor(level)
+
+
+def _is_compressible(headers):
+    content_type = ""
+    for name, value in headers:
+        name = name.lower()
+        if name == b"content-encoding":
+            return False
+        if name == b"content-type":
+            content_type = value.decode("latin-1").lower()
+    return content_type.startswith(_COMPRESSIBLE_TYPES) or "+json" in content_type
+
+
+def compressed_app(
+    server: "FastMCP",
+    transport: str = "streamable-http",
+    minimum_size: int = DEFAULT_MINIMUM_SIZE,
+    encodings: tuple | None = None,
+):
+    """
+    Builds the ASGI app of a FastMCP server with response compression.
+
+    Args:
+        server: A FastMCP server instance
+        transport: The HTTP-based transport, "streamable-http" or "sse"
+        minimum_size: Responses smaller than this many bytes are not compressed
+        encodings: Supported encodings, most preferred first (defaults to zstd
+            if available, then gzip)
+
+    Returns:
+        An ASGI app, e.g. to run with uvicorn
+    """
+    if transport == "sse":
+        app = server.sse_app()
+    elif transport == "streamable-http":
+        app = server.streamable_http_app()
+    else:
+        raise ValueError(f"Compression is not supported for transport: {transport}")
+    return CompressionMiddleware(app, minimum_size=minimum_size, encodings=encodings)
@@ -0,0 +1,168 @@
+import asyncio
+import functools
+import inspect
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mcp.server import FastMCP
+
+
+class ToolResources:
+    """
+    Resources (DB pools, HTTP sessions, loaded models, ...) used by the adapted
+    tools of a FastMCP server.
+
+    Each resource is created by a factory when the server starts, before any
+    request is handled, and closed when it shuts down: with the lifespan of
+    the server's ASGI app on HTTP transports, or of the session on stdio. A
+    factory may be a function or coroutine function returning the resource,
+    or returning a (sync or async) context manager whose entered value is the
+    resource. Plain resources with a close() or aclose() method are closed on
+    shutdown. Tools that declare the same factory share a single instance.
+    """
+
+    def __init__(self):
+        self._factories = []
+        self._values = {}
+        self._stack = None
+        self._users = 0
+        self._lock = asyncio.Lock()
+
+    def declare(self, factory):
+        """
+        Declares a resource factory, to be opened with the server.
+
+        Args:
+            factory: A callable creating the resource
+        """
+        if factory not in self._factories:
+            self._factories.append(factory)
+
+    def get(self, factory):
+        """
+        Returns the open resource created by a declared factory.
+
+        Args:
+            factory: The factory the resource was declared with
+
+        Returns:
+            The resource
+
+        Raises:
+            RuntimeError: If the resources are not open
+        """
+        try:
+            return self._values[factory]
+        except KeyError:
+            raise RuntimeError(
+                "Tool resources are only available while the server is running"
+            ) from None
+
+    async def __aenter__(self):
+        async with self._lock:
+            if self._users == 0:
+                stack = AsyncExitStack()
+                try:
+                    for factory in self._factories:
+                        self._values[factory] = await _open_resource(stack, factory)
+                except BaseException:
+                    self._values.clear()
+                    await stack.aclose()
+                    raise
+                self._stack = stack
+            self._users += 1
+        return self
+
+    async def __aexit__(self, *exc_info):
+        async with self._lock:
+            self._users -= 1
+            if self._users == 0:
+                stack, self._stack = self._stack, None
+                self._values.clear()
+                await stack.aclose()
+
+
+async def _open_resource(stack, factory):
+    resource = factory()
+    if inspect.isawaitable(resource):
+        resource = await resource
+
+    if hasattr(resource, "__aenter__"):
+        return await stack.enter_async_context(resource)
+    if hasattr(resource, "__enter__"):
+        return stack.enter_context(resource)
+
+    if hasattr(resource, "aclose"):
+        stack.push_async_callback(resource.aclose)
+    elif hasattr(resource, "close"):
+        stack.callback(resource.close)
+    return resource
+
+
+def hook_server_lifespan(server: "FastMCP", lifespan):
+    """
+    Runs a lifespan around the lifespans of a FastMCP server.
+
+    The low-level server's lifespan is entered for every session: once on
+    stdio, but per connection (SSE) or even per request (stateless streamable
+    HTTP) on HTTP transports. So the lifespan is also run around the lifespan
+    of the ASGI apps built by sse_app() and streamable_http_app(), which is
+    entered once while the app is served. An app mounted in another ASGI app
+    only runs its lifespan if the outer app forwards it.
+
+    Args:
+        server: A FastMCP server instance
+        lifespan: A callable returning an async context manager
+    """
+    lowlevel_server = server._mcp_server
+    server_lifespan = lowlevel_server.lifespan
+
+    @asynccontextmanager
+    async def session_lifespan(app):
+        async with lifespan():
+            async with server_lifespan(app) as context:
+                yield context
+
+    lowlevel_server.lifespan = session_lifespan
+
+    for name in ("sse_app", "streamable_http_app"):
+        build_app = getattr(server, name)
+
+        @functools.wraps(build_app)
+        def build(*args, _build_app=build_app, **kwargs):
+            app = _build_app(*args, **kwargs)
+            app_lifespan = app.router.lifespan_context
+
+            @asynccontextmanager
+            async def lifespan_context(app):
+                async with lifespan():
+                    async with app_lifespan(app) as state:
+                        yield state
+
+            app.router.lifespan_context = lifespan_context
+            return app
+
+        setattr(server, name, build)
+
+
+def get_tool_resources(server: "FastMCP") -> ToolResources:
+    """
+    Returns the ToolResources of a FastMCP server, hooking them into the
+    server's lifespans the first time (see hook_server_lifespan).
+
+    Args:
+        server: A FastMCP server instance
+
+    Returns:
+        The server's ToolResources
+    """
+    resources = getattr(server, "_tool_resources", None)
+    if resources is not None:
+        return resources
+
+    resources = ToolResources()
+    server._tool_resources = resources
+    # Resources are reference counted, so sessions of a running app share them
+    hook_server_lifespan(server, lambda: resources)
+    return resources
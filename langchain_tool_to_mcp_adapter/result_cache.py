@@ -0,0 +1,308 @@
+import functools
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from pydantic_core import from_json, to_json, to_jsonable_python
+
+from .warmup import is_warmup_call
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_BLOB_THRESHOLD = 64 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    tool TEXT NOT NULL,
+    value BLOB,
+    blob TEXT,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+"""
+
+
+class ResultCache:
+    """
+    A persistent, size-bounded cache of tool results shared by processes on
+    the same host.
+
+    Results are serialized as JSON and indexed in a SQLite database in
+    directory. Small results are stored in the database itself, results of
+    blob_threshold bytes or more in separate files, which keeps the database
+    small. The total size of the stored results is bounded by max_bytes,
+    evicting the least recently used entries first. Since the cache outlives
+    the process, it survives restarts and is shared by server replicas using
+    the same directory.
+
+    Unlike pickles, JSON entries cannot run code when read, so a tampered
+    cache directory cannot take over the server. Results come back as JSON
+    types: Pydantic models as dicts and tuples as lists.
+
+    Only cache tools whose results are a deterministic function of their
+    arguments, and change the tool version when that function changes.
+    """
+
+    def __init__(
+        self,
+        directory,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        blob_threshold: int = DEFAULT_BLOB_THRESHOLD,
+    ):
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self.blob_threshold = blob_threshold
+        self._blobs = os.path.join(self.directory, "blobs")
+        os.makedirs(self._blobs, exist_ok=True)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "errors": 0,
+        }
+        with self._connection() as connection:
+            connection.executescript(_SCHEMA)
+
+    @staticmethod
+    def key(tool, version, args, kwargs):
+        """
+        Returns the cache key of a tool call.
+
+        Args:
+            tool: The tool name
+            version: The tool version
+            args: The call's positional arguments
+            kwargs: The call's keyword arguments
+
+        Returns:
+            A hex digest of the tool name, version and canonicalized arguments
+        """
+        canonical = json.dumps(
+            [tool, version, to_jsonable_python([args, kwargs], fallback=repr)],
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key):
+        """
+        Looks up a cached result.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            A (found, result) tuple
+        """
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT value, blob FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self._count("misses")
+            return False, None
+
+        value, blob = row
+        try:
+            if blob is not None:
+                value = self._read_blob(blob)
+            else:
+                value = from_json(value)
+        except (OSError, ValueError):
+            # Evicted by another process, or left incomplete by a crash
+            with connection:
+                connection.execute("DELETE FROM results WHERE key = ?", (key,))
+            self._count("misses")
+            return False, None
+
+        with connection:
+            connection.execute(
+                "UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+        self._count("hits")
+        return True, value
+
+    def put(self, key, tool, result):
+        """
+        Stores a result, evicting the least recently used results if needed.
+
+        Results that cannot be serialized as JSON or are larger than max_bytes
+        are not stored.
+
+        Args:
+            key: The cache key
+            tool: The tool name
+            result: The result to store
+        """
+        try:
+            data = to_json(result, by_alias=True)
+        except ValueError:
+            return
+        if len(data) > self.max_bytes:
+            return
+
+        value = blob = None
+        if len(data) >= self.blob_threshold:
+            blob = self._write_blob(key, data)
+        else:
+            value = data
+
+        connection = self._connection()
+        with connection:
+            # Another call (possibly in another process) may have stored the
+            # same key concurrently; replace it and remove its blob
+            removed = [
+                name
+                for (name,) in connection.execute(
+                    "SELECT blob FROM results WHERE key = ? AND blob IS NOT NULL",
+                    (key,),
+                )
+            ]
+            connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                (key, tool, value, blob, len(data), time.time()),
+            )
+            removed += self._evict(connection)
+        for name in removed:
+            self._remove_blob(name)
+        self._count("stores")
+
+    def clear(self):
+        """Removes all cached results."""
+        connection = self._connection()
+        with connection:
+            blobs = connection.execute(
+                "SELECT blob FROM results WHERE blob IS NOT NULL"
+            ).fetchall()
+            connection.execute("DELETE FROM results")
+        for (name,) in blobs:
+            self._remove_blob(name)
+
+    def stats(self):
+        """
+        Returns cache statistics.
+
+        Returns:
+            A dictionary with this process's hits, misses, stores, evictions
+            and errors (calls served without the cache because it failed), and
+            the number of entries and bytes in the cache
+        """
+        entries, size = (
+            self._connection()
+            .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results")
+            .fetchone()
+        )
+        with self._lock:
+            return {**self._stats, "entries": entries, "bytes": size}
+
+    def __len__(self):
+        return self.stats()["entries"]
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                os.path.join(self.directory, "results.sqlite"), timeout=30
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _evict(self, connection):
+        (total,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()
+        evicted = []
+        if total <= self.max_bytes:
+            return evicted
+
+        rows = connection.execute(
+            "SELECT key, blob, size FROM results ORDER BY accessed"
+        )
+        for key, blob, size in rows.fetchall():
+            if total <= self.max_bytes:
+                break
+            connection.execute("DELETE FROM results WHERE key = ?", (key,))
+            total -= size
+            if blob is not None:
+                evicted.append(blob)
+            self._count("evictions")
+        return evicted
+
+    def _write_blob(self, key, data):
+        # Write under a unique name and rename, so readers in other processes
+        # never map a partially written file
+        file, temporary = tempfile.mkstemp(dir=self._blobs, suffix=".tmp")
+        with os.fdopen(file, "wb") as output:
+            output.write(data)
+        name = f"{key}-{os.path.basename(temporary)[:-4]}.json"
+        os.replace(temporary, os.path.join(self._blobs, name))
+        return name
+
+    def _read_blob(self, name):
+        # from_json needs bytes, so a memory map would only add a copy
+        with open(os.path.join(self._blobs, name), "rb") as file:
+            return from_json(file.read())
+
+    def _remove_blob(self, name):
+        try:
+            os.remove(os.path.join(self._blobs, name))
+        except FileNotFoundError:
+            pass
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+
+def cache_tool_results(func, tool, cache, version=None):
+    """
+    Serves a function's calls from a ResultCache.
+
+    Args:
+        func: The function to wrap, called with the tool's arguments
+        tool: The LangChain tool the function was reconstructed from
+        cache: The ResultCache to read and store results
+        version: The tool version, part of the cache key
+
+    Returns:
+        A function returning the cached result of a call with equal arguments
+        when there is one, and caching the results of other calls. Warmup
+        calls neither read nor fill the cache. If the cache fails (e.g. its
+        database is locked or the disk is full), calls run the tool.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if is_warmup_call():
+            return func(*args, **kwargs)
+        key = cache.key(tool.name, version, args, kwargs)
+        try:
+            found, result = cache.get(key)
+        except (sqlite3.Error, OSError):
+            logger.warning("Result cache lookup failed", exc_info=True)
+            cache._count("errors")
+            found = False
+        if found:
+            return result
+        result = func(*args, **kwargs)
+        try:
+            cache.put(key, tool.name, result)
+        except (sqlite3.Error, OSError):
+            logger.warning("Result cache store failed", exc_info=True)
+            cache._count("errors")
+        return result
+
+    return wrapper
@@ -0,0 +1,260 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+import random
+import threading
+import time
+from collections import deque
+
+import anyio.to_thread
+
+from .warmup import is_warmup_call
+
+DEFAULT_RETRY_ON = (ConnectionError, TimeoutError)
+
+_attempt = contextvars.ContextVar("retry_attempt", default=None)
+
+
+class RetryPolicy:
+    """
+    Retries and hedges calls of idempotent tools.
+
+    A call failing with one of the retry_on exceptions is retried up to
+    attempts times in total, sleeping between attempts with exponential
+    backoff (starting at backoff seconds, capped at max_backoff) and full
+    jitter. Other exceptions are raised immediately.
+
+    With hedge_percentile set, when an attempt takes longer than that
+    percentile of the tool's recent latencies, a duplicate attempt is started
+    (at most max_hedges per attempt). The first successful result wins; the
+    others are abandoned. Hedging starts after hedge_min_samples calls have
+    completed. Latencies only cover running the tool itself: calls served by
+    a result cache or waiting for a scheduler slot neither add samples nor
+    start the hedge delay.
+
+    Only use a policy for tools that are safe to call more than once.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        retry_on: tuple = DEFAULT_RETRY_ON,
+        backoff: float = 0.1,
+        max_backoff: float = 2.0,
+        jitter: bool = True,
+        hedge_percentile: float | None = None,
+        max_hedges: int = 1,
+        hedge_min_samples: int = 20,
+        window: int = 1000,
+    ):
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1")
+        self.attempts = attempts
+        self.retry_on = tuple(retry_on)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.hedge_percentile = hedge_percentile
+        self.max_hedges = max_hedges
+        self.hedge_min_samples = hedge_min_samples
+        self.window = window
+        self._lock = threading.Lock()
+        self._stats = {
+            "calls": 0,
+            "retries": 0,
+            "hedges": 0,
+            "hedge_wins": 0,
+            "failures": 0,
+        }
+
+    def stats(self):
+        """
+        Returns retry and hedging statistics.
+
+        Returns:
+            A dictionary with the number of calls, retries, hedged attempts,
+            hedged attempts that returned first, and calls that failed
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def backoff_delay(self, attempt):
+        """
+        Returns the time to sleep before retrying.
+
+        Args:
+            attempt: The number of the attempt that failed, starting at 1
+
+        Returns:
+            The delay in seconds
+        """
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def _record(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class _Attempt:
+    """Tracks when an attempt's tool execution starts, and how long it takes."""
+
+    def __init__(self, latencies):
+        self.latencies = latencies
+        self.started = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+
+    def start(self):
+        # Called in the worker thread running the tool
+        self._loop.call_soon_threadsafe(self.started.set)
+
+    def finish(self, latency):
+        self.latencies.append(latency)
+
+
+def time_tool_calls(func):
+    """
+    Reports the execution of a function's calls to the retry attempt they
+    belong to, as latency samples for hedging.
+
+    Apply it below a result cache and inside a scheduler slot, so cache hits
+    and slot waits are not timed.
+
+    Args:
+        func: The function running the tool
+
+    Returns:
+        A function reporting when each call starts and how long it takes
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        attempt = _attempt.get()
+        if attempt is None:
+            return func(*args, **kwargs)
+        attempt.start()
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            attempt.finish(time.perf_counter() - started)
+
+    return wrapper
+
+
+def retry_tool_calls(func, policy):
+    """
+    Retries, and optionally hedges, a function's calls according to a policy.
+
+    Attempts of a synchronous function run in worker threads, and backoff
+    waits are asynchronous, so retries never block the event loop. Hedge
+    delays come from the latencies reported by time_tool_calls, which must
+    wrap the tool inside func.
+
+    Args:
+        func: The function to wrap, called with the tool's arguments. It may
+            be a coroutine function (e.g. one running calls through a
+            PriorityScheduler).
+        policy: The RetryPolicy to apply
+
+    Returns:
+        An async function returning the first successful result of its attempts
+    """
+    latencies = deque(maxlen=policy.window)
+
+    if inspect.iscoroutinefunction(func):
+        call = func
+    else:
+
+        async def call(*args, **kwargs):
+            return await anyio.to_thread.run_sync(
+                functools.partial(func, *args, **kwargs)
+            )
+
+    async def timed_call(args, kwargs, tracker=None):
+        token = _attempt.set(tracker or _Attempt(latencies))
+        try:
+            return await call(*args, **kwargs)
+        finally:
+            _attempt.reset(token)
+
+    def hedge_delay():
+        if policy.hedge_percentile is None:
+            return None
+        if len(latencies) < policy.hedge_min_samples:
+            return None
+        return _percentile(latencies, policy.hedge_percentile)
+
+    async def hedged_call(args, kwargs, delay):
+        tracker = _Attempt(latencies)
+        first = asyncio.ensure_future(timed_call(args, kwargs, tracker))
+        pending = {first}
+        hedges = 0
+        error = None
+        started = asyncio.ensure_future(tracker.started.wait())
+        try:
+            # The hedge delay runs from when the tool starts, not while the
+            # call waits for a slot; cache hits finish without starting it
+            await asyncio.wait({first, started}, return_when=asyncio.FIRST_COMPLETED)
+            while pending:
+                timeout = delay if hedges < policy.max_hedges else None
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    pending.add(asyncio.ensure_future(timed_call(args, kwargs)))
+                    hedges += 1
+                    policy._record("hedges")
+                    continue
+                for task in done:
+                    if task.exception() is None:
+                        if task is not first:
+                            policy._record("hedge_wins")
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            started.cancel()
+            # Losing attempts are abandoned; a running thread finishes on its own
+            for task in pending:
+                task.cancel()
+                task.add_done_callback(_consume_result)
+
+    async def attempt(args, kwargs):
+        delay = hedge_delay()
+        if delay is None:
+            return await timed_call(args, kwargs)
+        return await hedged_call(args, kwargs, delay)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        # Cold warmup calls would skew the statistics and hedge delays
+        if is_warmup_call():
+            return await call(*args, **kwargs)
+        policy._record("calls")
+        for number in range(1, policy.attempts + 1):
+            try:
+                return await attempt(args, kwargs)
+            except policy.retry_on:
+                if number == policy.attempts:
+                    policy._record("failures")
+                    raise
+                policy._record("retries")
+                await asyncio.sleep(policy.backoff_delay(number))
+            except Exception:
+                policy._record("failures")
+                raise
+
+    return wrapper
+
+
+def _consume_result(task):
+    if not task.cancelled():
+        task.exception()
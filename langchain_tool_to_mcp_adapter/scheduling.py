@@ -0,0 +1,150 @@
+import asyncio
+import functools
+import itertools
+import time
+
+import anyio.to_thread
+
+from .warmup import is_warmup_call
+
+PRIORITY_CLASSES = ("interactive", "normal", "background")
+
+
+class PriorityScheduler:
+    """
+    Runs tool calls in a bounded number of execution slots, handing free slots
+    to waiting calls by priority class.
+
+    Classes are ordered from most to least urgent. While a call waits, its
+    priority rises by one class every aging_interval seconds, so calls of lower
+    classes are delayed under load but never starved. Tool functions run in
+    worker threads, keeping the event loop free while they execute.
+    """
+
+    def __init__(
+        self,
+        slots: int = 4,
+        aging_interval: float = 5.0,
+        classes: tuple = PRIORITY_CLASSES,
+    ):
+        self.slots = slots
+        self.aging_interval = aging_interval
+        self.classes = tuple(classes)
+        self._levels = {name: level for level, name in enumerate(self.classes)}
+        self._running = 0
+        self._waiters = []
+        self._sequence = itertools.count()
+        self._stats = {
+            name: {
+                "queued": 0,
+                "running": 0,
+                "completed": 0,
+                "total_wait": 0.0,
+                "max_wait": 0.0,
+            }
+            for name in self.classes
+        }
+
+    def resolve(self, requested, default):
+        """
+        Picks the priority class of a call.
+
+        Args:
+            requested: The class requested by the client, if any
+            default: The tool's priority class
+
+        Returns:
+            The requested class if it is known, otherwise the default
+        """
+        return requested if requested in self._levels else default
+
+    def metrics(self):
+        """
+        Returns per-class queue metrics.
+
+        Returns:
+            A dictionary mapping each priority class to its number of queued,
+            running and completed calls, and its total and maximum time spent
+            waiting for a slot (in seconds)
+        """
+        return {name: dict(stats) for name, stats in self._stats.items()}
+
+    async def run(self, priority, func, *args, **kwargs):
+        """
+        Runs a function in a worker thread once a slot is available.
+
+        Args:
+            priority: The priority class of the call
+            func: The function to run
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            The function's result
+        """
+        if is_warmup_call():
+            # Warmup runs before serving, outside the slots and metrics
+            return await anyio.to_thread.run_sync(
+                functools.partial(func, *args, **kwargs)
+            )
+        await self._acquire(priority)
+        try:
+            return await anyio.to_thread.run_sync(
+                functools.partial(func, *args, **kwargs)
+            )
+        finally:
+            self._release(priority)
+
+    async def _acquire(self, priority):
+        stats = self._stats[priority]
+        if self._running < self.slots and not self._waiters:
+            self._running += 1
+            stats["running"] += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        order = (self._levels[priority], time.monotonic(), next(self._sequence))
+        entry = (order, priority, future)
+        self._waiters.append(entry)
+        stats["queued"] += 1
+        try:
+            await future
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                self._release(priority, completed=False)
+            elif entry in self._waiters:
+                self._waiters.remove(entry)
+                stats["queued"] -= 1
+            raise
+
+    def _release(self, priority, completed=True):
+        stats = self._stats[priority]
+        self._running -= 1
+        stats["running"] -= 1
+        if completed:
+            stats["completed"] += 1
+        self._dispatch()
+
+    def _dispatch(self):
+        while self._running < self.slots and self._waiters:
+            now = time.monotonic()
+            entry = min(self._waiters, key=lambda entry: self._urgency(entry, now))
+            self._waiters.remove(entry)
+            (_, enqueued_at, _), priority, future = entry
+
+            stats = self._stats[priority]
+            stats["queued"] -= 1
+            if future.cancelled():
+                continue
+
+            wait = now - enqueued_at
+            stats["total_wait"] += wait
+            stats["max_wait"] = max(stats["max_wait"], wait)
+
+            self._running += 1
+            stats["running"] += 1
+            future.set_result(None)
+
+    def _urgency(self, entry, now):
+        (level, enqueued_at, sequence), _, _ = entry
+        return (level - (now - enqueued_at) / self.aging_interval, sequence)
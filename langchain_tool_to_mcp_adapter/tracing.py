@@ -0,0 +1,166 @@
+import functools
+import random
+import threading
+import time
+
+from .warmup import is_warmup_call
+
+
+class TracingPolicy:
+    """
+    Decides which adapted tool calls are reported to LangChain callbacks and
+    tracers (including LangSmith, when enabled through the environment).
+
+    Adapted tools call the tool function directly, so by default no callbacks
+    run. A fraction sample_rate of calls is run under a callback manager, like
+    BaseTool.run does, and calls slower than latency_threshold seconds are
+    reported once they complete. All other calls stay on the callback-free fast
+    path. The time spent in callback handling is accounted in stats().
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.0,
+        latency_threshold: float | None = None,
+        callbacks=None,
+        tags: list | None = None,
+        metadata: dict | None = None,
+    ):
+        self.sample_rate = sample_rate
+        self.latency_threshold = latency_threshold
+        self.callbacks = callbacks
+        self.tags = tags
+        self.metadata = metadata
+        self._lock = threading.Lock()
+        self._stats = {
+            "calls": 0,
+            "sampled": 0,
+            "slow": 0,
+            "callback_seconds": 0.0,
+        }
+
+    def stats(self):
+        """
+        Returns tracing statistics.
+
+        Returns:
+            A dictionary with the number of calls, the number reported because
+            they were sampled or slow, and the total time spent in callback
+            handling (in seconds)
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def should_sample(self):
+        """Returns whether the next call should run under callbacks."""
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def callback_manager(self, tool, metadata=None):
+        """
+        Configures the callback manager for a traced call of a tool.
+
+        Args:
+            tool: The LangChain tool being called
+            metadata: Extra metadata for the call's run
+
+        Returns:
+            A CallbackManager combining the policy's and the tool's callbacks
+        """
+        # Imported on first use: loading LangChain's callbacks slows startup
+        from langchain_core.callbacks import CallbackManager
+
+        return CallbackManager.configure(
+            inheritable_callbacks=self.callbacks,
+            local_callbacks=tool.callbacks,
+            verbose=tool.verbose,
+            inheritable_tags=self.tags,
+            local_tags=tool.tags,
+            inheritable_metadata=self.metadata,
+            local_metadata={**(tool.metadata or {}), **(metadata or {})},
+        )
+
+    def _record(self, reason=None, callback_seconds=0.0):
+        with self._lock:
+            self._stats["calls"] += 1
+            if reason is not None:
+                self._stats[reason] += 1
+            self._stats["callback_seconds"] += callback_seconds
+
+
+def trace_tool_calls(func, tool, policy):
+    """
+    Reports a function's calls to LangChain callbacks according to a policy.
+
+    Args:
+        func: The function to wrap, called with the tool's arguments
+        tool: The LangChain tool the function was reconstructed from
+        policy: The TracingPolicy deciding which calls are reported
+
+    Returns:
+        A function that runs traced calls under a callback manager. Warmup
+        calls are neither reported nor counted.
+    """
+
+    def start_run(kwargs, metadata=None):
+        return policy.callback_manager(tool, metadata).on_tool_start(
+            {"name": tool.name, "description": tool.description},
+            str(kwargs),
+            name=tool.name,
+            inputs=kwargs,
+        )
+
+    def run_sampled(args, kwargs):
+        started = time.perf_counter()
+        run_manager = start_run(kwargs)
+        overhead = time.perf_counter() - started
+        try:
+            result = func(*args, **kwargs)
+        except Exception as error:
+            started = time.perf_counter()
+            run_manager.on_tool_error(error)
+            policy._record("sampled", overhead + time.perf_counter() - started)
+            raise
+        started = time.perf_counter()
+        run_manager.on_tool_end(result, name=tool.name)
+        policy._record("sampled", overhead + time.perf_counter() - started)
+        return result
+
+    def report_slow(kwargs, latency, result=None, error=None):
+        started = time.perf_counter()
+        run_manager = start_run(kwargs, metadata={"latency_seconds": latency})
+        if error is not None:
+            run_manager.on_tool_error(error)
+        else:
+            run_manager.on_tool_end(result, name=tool.name)
+        policy._record("slow", time.perf_counter() - started)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if is_warmup_call():
+            return func(*args, **kwargs)
+        if policy.should_sample():
+            return run_sampled(args, kwargs)
+
+        if policy.latency_threshold is None:
+            policy._record()
+            return func(*args, **kwargs)
+
+        started = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as error:
+            latency = time.perf_counter() - started
+            if latency >= policy.latency_threshold:
+                report_slow(kwargs, latency, error=error)
+            else:
+                policy._record()
+            raise
+
+        latency = time.perf_counter() - started
+        if latency >= policy.latency_threshold:
+            report_slow(kwargs, latency, result=result)
+        else:
+            policy._record()
+        return result
+
+    return wrapper
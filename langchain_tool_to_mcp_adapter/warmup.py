@@ -0,0 +1,234 @@
+import asyncio
+import contextvars
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+from .resources import get_tool_resources, hook_server_lifespan
+
+if TYPE_CHECKING:
+    from langchain_core.tools import BaseTool
+    from mcp.server import FastMCP
+
+logger = logging.getLogger(__name__)
+
+_warming_up = contextvars.ContextVar("warming_up", default=False)
+
+
+def is_warmup_call():
+    """
+    Returns whether the current tool call is a warmup call.
+
+    Warmup calls bypass the result cache and tracing, and are left out of
+    retry and scheduler statistics.
+    """
+    return _warming_up.get()
+
+
+class ToolWarmup:
+    """
+    Sample calls that exercise the adapted tools of a FastMCP server before it
+    handles requests.
+
+    The first calls of a tool pay for cold validators, lazily created clients,
+    empty caches and the wrapper chain. Warmup calls go through the server's
+    full tool call path once, after the tool resources are opened and before
+    the server serves traffic, so real requests do not pay this latency. Failing
+    warmup calls are logged and reported, but do not prevent serving.
+
+    Warmup runs once per server. With parallel, the tools are warmed up
+    concurrently (each tool's inputs in turn), which shortens startup for tools
+    run in worker threads by a PriorityScheduler.
+    """
+
+    def __init__(self, parallel: bool = False):
+        self.parallel = parallel
+        self.report = None
+        self._inputs = {}
+        self._lock = asyncio.Lock()
+
+    def declare(self, name, inputs):
+        """
+        Declares sample inputs of a tool.
+
+        Args:
+            name: The tool's name on the server
+            inputs: A list of argument dictionaries, each called once
+        """
+        self._inputs.setdefault(name, []).extend(inputs)
+
+    async def run(self, server: "FastMCP"):
+        """
+        Calls every tool with its sample inputs, unless this already happened.
+
+        Args:
+            server: The FastMCP server the tools are registered with
+
+        Returns:
+            The warmup report: the total time in seconds, and for each tool
+            the number of calls and errors and the latency of each call in
+            milliseconds
+        """
+        async with self._lock:
+            if self.report is not None:
+                return self.report
+
+            started = time.perf_counter()
+            names = list(self._inputs)
+            if self.parallel:
+                results = await asyncio.gather(
+                    *(self._warm_up(server, name) for name in names)
+                )
+            else:
+                results = [await self._warm_up(server, name) for name in names]
+
+            self.report = {
+                "seconds": time.perf_counter() - started,
+                "tools": dict(zip(names, results)),
+            }
+            logger.info(
+                "Warmed up %d tools in %.1f ms",
+                len(names),
+                self.report["seconds"] * 1000,
+            )
+            return self.report
+
+    async def _warm_up(self, server, name):
+        latencies = []
+        errors = 0
+        token = _warming_up.set(True)
+        try:
+            for arguments in self._inputs[name]:
+                started = time.perf_counter()
+                try:
+                    await server.call_tool(name, arguments)
+                except Exception:
+                    errors += 1
+                    logger.warning("Warmup call of %s failed", name, exc_info=True)
+                latencies.append((time.perf_counter() - started) * 1000)
+        finally:
+            # Requests served later must not inherit the flag
+            _warming_up.reset(token)
+
+        logger.info(
+            "Warmed up %s: %s",
+            name,
+            ", ".join(f"{latency:.1f} ms" for latency in latencies),
+        )
+        return {"calls": len(latencies), "errors": errors, "latency_ms": latencies}
+
+
+def warmup_inputs(tool: "BaseTool", parameters: dict):
+    """
+    Returns the sample inputs of a tool.
+
+    Args:
+        tool: A LangChain tool, which may declare a list of argument
+            dictionaries as the "warmup_inputs" key of its metadata
+        parameters: The JSON schema of the tool's arguments on the server
+
+    Returns:
+        The declared inputs, or a single input synthesized from the schema
+    """
+    declared = (tool.metadata or {}).get("warmup_inputs")
+    if declared is not None:
+        return list(declared)
+    return [synthesize_arguments(parameters)]
+
+
+def synthesize_arguments(schema: dict):
+    """
+    Synthesizes valid-looking arguments from a JSON schema.
+
+    Only required properties are filled in, preferring defaults, constants,
+    enum values and examples, then minimal values of the declared type.
+
+    Args:
+        schema: The JSON schema of the arguments object
+
+    Returns:
+        An argument dictionary
+    """
+    definitions = schema.get("$defs", {})
+
+    def value(node):
+        if "$ref" in node:
+            return value(definitions[node["$ref"].rsplit("/", 1)[-1]])
+        if "default" in node:
+            return node["default"]
+        if "const" in node:
+            return node["const"]
+        if node.get("enum"):
+            return node["enum"][0]
+        if node.get("examples"):
+            return node["examples"][0]
+        for key in ("anyOf", "oneOf", "allOf"):
+            if key in node:
+                options = [
+                    option for option in node[key] if option.get("type") != "null"
+                ]
+                return value((options or node[key])[0])
+
+        node_type = node.get("type")
+        if isinstance(node_type, list):
+            node_type = next((t for t in node_type if t != "null"), "null")
+
+        if node_type == "object":
+            required = node.get("required", [])
+            return {
+                name: value(property_schema)
+                for name, property_schema in node.get("properties", {}).items()
+                if name in required
+            }
+        if node_type == "array":
+            return [value(node.get("items", {}))] * node.get("minItems", 0)
+        if node_type == "string":
+            text = "warmup".ljust(node.get("minLength", 0), "x")
+            return text[: node.get("maxLength", len(text))]
+        if node_type in ("integer", "number"):
+            number = node.get("minimum")
+            if number is None and "exclusiveMinimum" in node:
+                number = node["exclusiveMinimum"] + 1
+            if number is None:
+                number = min(0, node.get("maximum", 0))
+            return int(number) if node_type == "integer" else float(number)
+        if node_type == "boolean":
+            return False
+        return None
+
+    return value({**schema, "type": "object"})
+
+
+def get_tool_warmup(server: "FastMCP") -> ToolWarmup:
+    """
+    Returns the ToolWarmup of a FastMCP server, hooking it into the server's
+    lifespans the first time (see hook_server_lifespan).
+
+    The warmup runs when the server starts, after the tool resources are
+    opened and before any request is handled, unless it was run before (e.g.
+    by the langchain-to-mcp launcher ahead of signaling readiness).
+
+    Args:
+        server: A FastMCP server instance
+
+    Returns:
+        The server's ToolWarmup
+    """
+    warmup = getattr(server, "_tool_warmup", None)
+    if warmup is not None:
+        return warmup
+
+    warmup = ToolWarmup()
+    server._tool_warmup = warmup
+
+    resources = get_tool_resources(server)
+
+    @asynccontextmanager
+    async def lifespan():
+        async with resources:
+            await warmup.run(server)
+            yield
+
+    hook_server_lifespan(server, lifespan)
+    return warmup
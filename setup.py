@@ -25,11 +25,20 @@ setup(
     ],
     python_requires=">=3.10",
     install_requires=[
-        "langchain>=0.1.0,<0.4.0",
+        "langchain-core>=0.1.0,<0.4.0",
         "fastmcp>=2.2.0",
+        "mcp>=1.10",
         "pydantic>=2.0.0,<3.0.0"
     ],
+    entry_points={
+        "console_scripts": [
+            "langchain-to-mcp=langchain_tool_to_mcp_adapter.cli:main",
+        ],
+    },
     extras_require={
+        "uvloop": ["uvloop"],
+        "zstd": ["zstandard"],
+        "images": ["Pillow"],
         "dev": [
             "pytest>=7.0.0",
             "black>=23.0.0",
@@ -3,14 +3,13 @@ Example of converting a LangChain tool that returns artifacts to an MCP tool.
 
 This file defines and runs an MCP server with a converted LangChain tool that returns text and an image.
 """
-from langchain.tools import Tool
+from langchain_core.tools import Tool
 from pydantic import BaseModel, Field
 from mcp.server import FastMCP
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from langchain_tool_to_mcp_adapter import add_langchain_tool_to_server
-import base64
 import logging
 
 # Set up logging for debugging
@@ -34,18 +33,6 @@ class PDFRequestInput(BaseModel):
         default=True
     )
 
-def get_image_data(image_path):
-    """Get base64 encoded image data from a file path."""
-    with open(image_path, "rb") as image_file:
-        encoded_string = base64.b64encode(image_file.read()).decode("utf-8")
-    return encoded_string
-
-def get_file_data(file_path):
-    """Get base64 encoded data from a file path."""
-    with open(file_path, "rb") as file:
-        encoded_string = base64.b64encode(file.read()).decode("utf-8")
-    return encoded_string
-
 # Create a function that returns text and an image
 def get_mcp_logo(show_logo: bool = True):
     """Return the MCP logo and a description."""
@@ -58,15 +45,11 @@ def get_mcp_logo(show_logo: bool = True):
     current_dir = os.path.dirname(os.path.abspath(__file__))
     image_path = os.path.join(current_dir, "mcp.jpeg")
     
-    # Encode the image
-    encoded_image = get_image_data(image_path)
-    image_data_uri = f"data:image/jpeg;base64,{encoded_image}"
-    
-    # Create the artifacts list
+    # Create the artifacts list; the adapter encodes the file once and caches it
     artifacts = [{
         "type": "image_url",
         "image_url": {
-            "url": image_data_uri
+            "file_path": image_path
         }
     }]
     
@@ -85,16 +68,12 @@ def get_agents_guide(include_summary: bool = True):
     current_dir = os.path.dirname(os.path.abspath(__file__))
     pdf_path = os.path.join(current_dir, "a-practical-guide-to-building-agents.pdf")
     
-    # Encode the PDF
-    encoded_pdf = get_file_data(pdf_path)
-    pdf_data_uri = f"data:application/pdf;base64,{encoded_pdf}"
-    
-    # Create the artifacts list
+    # Create the artifacts list; the adapter encodes the file once and caches it
     artifacts = [{
         "type": "file",
         "file": {
             "filename": "a-practical-guide-to-building-agents.pdf",
-            "file_data": pdf_data_uri
+            "file_path": pdf_path
         }
     }]
     
@@ -3,7 +3,7 @@ Example of converting a LangChain calculator tool to an MCP tool.
 
 This file defines and runs an MCP server with a converted LangChain calculator tool.
 """
-from langchain.tools import Tool
+from langchain_core.tools import Tool
 import uvicorn
 import os
 import argparse
@@ -4,7 +4,7 @@ Configuration and fixtures for pytest.
 
 import pytest
 from mcp.server import FastMCP
-from langchain.tools import Tool
+from langchain_core.tools import Tool
 
 
 @pytest.fixture
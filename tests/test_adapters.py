@@ -2,6 +2,7 @@
 Tests for adapter.py's artifact response handling.
 """
 
+from langchain_tool_to_mcp_adapter import ArtifactCache
 from langchain_tool_to_mcp_adapter.adapter import handle_artifact_response
 
 
@@ -79,3 +80,27 @@ def test_response_metadata_preserved():
     assert wrapped.__name__ == "original_name"
     assert wrapped.__doc__ == "original doc"
     assert wrapped.__annotations__ == {"param": str, "return": str}
+
+
+def test_handle_file_path_artifact(tmp_path):
+    """Test that file-backed artifacts are built once and then cached."""
+    image_path = tmp_path / "logo.png"
+    image_path.write_bytes(b"\x89PNG")
+
+    def mock_artifact_func(*args, **kwargs):
+        artifacts = [{"type": "image_url", "image_url": {"file_path": str(image_path)}}]
+        return "Here is the logo", artifacts
+
+    mock_artifact_func.response_format = "content_and_artifact"
+
+    cache = ArtifactCache()
+    wrapped = handle_artifact_response(mock_artifact_func, cache)
+
+    first = wrapped()
+    second = wrapped()
+
+    assert first[1].type == "image"
+    assert first[1].mimeType == "image/png"
+    assert first[1].data == "data:image/png;base64,iVBORw=="
+    assert second[1] is first[1]
+    assert len(cache) == 1
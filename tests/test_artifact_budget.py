@@ -0,0 +1,187 @@
+"""
+Tests for artifact size budgets.
+"""
+
+import asyncio
+import base64
+import gc
+
+import pytest
+from langchain_core.tools import Tool
+from mcp.server import FastMCP
+from mcp.types import ResourceLink, TextContent
+
+from langchain_tool_to_mcp_adapter import ArtifactBudget, add_langchain_tool_to_server
+from langchain_tool_to_mcp_adapter.adapter import handle_artifact_response
+
+
+def _artifact_func(file_name, data, mime_type="application/octet-stream"):
+    encoded = base64.b64encode(data).decode("ascii")
+
+    def func():
+        artifacts = [
+            {
+                "type": "file",
+                "file": {
+                    "filename": file_name,
+                    "file_data": f"data:{mime_type};base64,{encoded}",
+                },
+            }
+        ]
+        return "Here is the file.", artifacts
+
+    func.response_format = "content_and_artifact"
+    return func
+
+
+def test_in_flight_artifacts_are_accounted_until_released():
+    """Test that admitted artifacts count against the budget while held."""
+    budget = ArtifactBudget(max_artifact_bytes=1024, max_in_flight_bytes=1024)
+    func = handle_artifact_response(
+        _artifact_func("a.bin", b"x" * 400), artifact_budget=budget
+    )
+
+    first = func()
+    assert budget.in_flight_bytes > 400
+    second = func()
+
+    # The second artifact would exceed the in-flight limit, so it is spilled
+    assert isinstance(second[1], ResourceLink)
+
+    del first
+    gc.collect()
+    assert budget.in_flight_bytes == 0
+    assert budget.stats()["peak_in_flight_bytes"] > 400
+
+
+def test_oversized_artifact_is_spilled_and_served_as_resource():
+    """Test that a spilled artifact can be read back through the server."""
+    data = bytes(range(256)) * 100
+    export = _artifact_func("export.bin", data)
+    export.__name__ = "export"
+    tool = Tool(
+        name="export",
+        description="Export a large file",
+        func=export,
+        response_format="content_and_artifact",
+    )
+    server = FastMCP()
+    budget = ArtifactBudget(max_artifact_bytes=1024)
+    add_langchain_tool_to_server(server, tool, artifact_budget=budget)
+
+    async def call_and_read():
+        content = await server.call_tool("export", {})
+        link = content[1]
+        base = str(link.uri).rsplit("/", 1)[0]
+        parts = [
+            list(await server.read_resource(f"{base}/{part}"))[0].content
+            for part in range(link.meta["parts"])
+        ]
+        return link, parts
+
+    link, parts = asyncio.run(call_and_read())
+
+    assert isinstance(link, ResourceLink)
+    assert link.name == "export.bin"
+    assert link.size == len(data)
+    # Each part is read on its own, within the per-artifact limit
+    assert all(len(base64.b64encode(part)) <= 1024 for part in parts)
+    assert b"".join(parts) == data
+    assert budget.stats()["spilled"] == 1
+
+
+def test_oversized_file_is_served_by_reference(tmp_path):
+    """Test that a file-backed artifact over budget is not read or copied."""
+    path = tmp_path / "dump.csv"
+    path.write_bytes(b"a,b\n" * 1000)
+
+    def func():
+        artifacts = [
+            {"type": "file", "file": {"filename": "dump.csv", "file_path": str(path)}}
+        ]
+        return "Here is the dump.", artifacts
+
+    func.response_format = "content_and_artifact"
+    budget = ArtifactBudget(max_artifact_bytes=1024)
+
+    _, link = handle_artifact_response(func, artifact_budget=budget)()
+
+    assert link.mimeType == "text/csv"
+    assert budget.spilled_path(str(link.uri).split("/")[-2]) == str(path)
+    assert budget.stats()["spill_bytes"] == 0
+
+    # Further results of the same file reuse its entry
+    _, again = handle_artifact_response(func, artifact_budget=budget)()
+    assert again.uri == link.uri
+    assert len(budget._state.spilled) == 1
+
+
+def test_spilled_artifacts_are_bounded(tmp_path):
+    """Test that the least recently used spilled artifacts are evicted."""
+    budget = ArtifactBudget(max_artifact_bytes=64, max_spilled_artifacts=2)
+    links = [
+        handle_artifact_response(
+            _artifact_func(f"{n}.bin", bytes([n]) * 100), artifact_budget=budget
+        )()[1]
+        for n in range(3)
+    ]
+    keys = [str(link.uri).split("/")[-2] for link in links]
+
+    assert budget.spilled_path(keys[0]) is None
+    assert all(budget.spilled_path(key) is not None for key in keys[1:])
+    assert budget.stats()["spill_bytes"] == 200
+
+
+def test_truncate_policy():
+    """Test that text is truncated and binary artifacts are omitted."""
+    budget = ArtifactBudget(max_artifact_bytes=512, policy="truncate")
+    text = handle_artifact_response(
+        _artifact_func("log.txt", b"line\n" * 1000, "text/plain"),
+        artifact_budget=budget,
+    )()[1]
+    binary = handle_artifact_response(
+        _artifact_func("blob.bin", b"\0" * 5000), artifact_budget=budget
+    )()[1]
+
+    assert text.meta == {"truncated": True}
+    assert len(str(text.resource.uri)) <= 512
+    assert base64.b64decode(str(text.resource.uri).partition(",")[2]).startswith(
+        b"line"
+    )
+    assert isinstance(binary, TextContent)
+    assert "blob.bin" in binary.text
+
+
+def test_tool_budgets_share_the_in_flight_limit():
+    """Test that per-tool budgets account in-flight bytes together."""
+    budget = ArtifactBudget(max_in_flight_bytes=4096)
+    small = budget.for_tool(max_artifact_bytes=1024, policy="truncate")
+    func = handle_artifact_response(
+        _artifact_func("a.bin", b"x" * 600), artifact_budget=small
+    )
+
+    held = func()
+
+    assert small.max_artifact_bytes == 1024
+    assert budget.in_flight_bytes == small.in_flight_bytes > 0
+    assert held[1].resource.blob == "a.bin"
+    with pytest.raises(ValueError):
+        budget.for_tool(policy="shrink")
+
+
+def test_downsample_policy():
+    """Test that oversized images are scaled down to fit."""
+    Image = pytest.importorskip("PIL.Image")
+    import io
+
+    output = io.BytesIO()
+    Image.effect_noise((256, 256), 64).save(output, format="PNG")
+    budget = ArtifactBudget(max_artifact_bytes=16 * 1024, policy="downsample")
+
+    image = handle_artifact_response(
+        _artifact_func("noise.png", output.getvalue(), "image/png"),
+        artifact_budget=budget,
+    )()[1]
+
+    assert image.meta == {"downsampled": True}
+    assert len(str(image.resource.uri)) <= 16 * 1024
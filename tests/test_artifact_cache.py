@@ -0,0 +1,63 @@
+"""
+Tests for the file-backed artifact cache.
+"""
+
+import os
+
+from langchain_tool_to_mcp_adapter import ArtifactCache
+
+
+def _write(path, data):
+    with open(path, "wb") as file:
+        file.write(data)
+
+
+def test_repeated_lookup_reuses_content(tmp_path):
+    """Test that an unchanged file is only read and built once."""
+    path = str(tmp_path / "logo.png")
+    _write(path, b"logo")
+    cache = ArtifactCache()
+    builds = []
+
+    def build(encoded):
+        builds.append(encoded)
+        return object()
+
+    first = cache.get(path, build)
+    second = cache.get(path, build)
+
+    assert first is second
+    assert builds == ["bG9nbw=="]
+
+
+def test_changed_file_is_rebuilt(tmp_path):
+    """Test that a change in mtime or size invalidates the entry."""
+    path = str(tmp_path / "report.pdf")
+    _write(path, b"v1")
+    cache = ArtifactCache()
+
+    first = cache.get(path, lambda encoded: encoded)
+    _write(path, b"version 2")
+    os.utime(path, ns=(0, 0))
+    second = cache.get(path, lambda encoded: encoded)
+
+    assert first != second
+    assert len(cache) == 1
+
+
+def test_byte_budget_evicts_least_recently_used(tmp_path):
+    """Test that the cache stays within its byte budget."""
+    paths = []
+    for name in ("a", "b", "c"):
+        path = str(tmp_path / name)
+        _write(path, b"123")  # 4 bytes once base64 encoded
+        paths.append(path)
+    cache = ArtifactCache(max_bytes=8)
+
+    cache.get(paths[0], lambda encoded: encoded)
+    cache.get(paths[1], lambda encoded: encoded)
+    cache.get(paths[0], lambda encoded: encoded)
+    cache.get(paths[2], lambda encoded: encoded)
+
+    assert cache.current_bytes == 8
+    assert set(key[0] for key in cache._entries) == {paths[0], paths[2]}
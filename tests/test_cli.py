@@ -0,0 +1,139 @@
+"""
+Tests for the langchain-to-mcp command line launcher.
+"""
+
+import asyncio
+import os
+import socket
+
+import pytest
+from langchain_core.tools import StructuredTool
+
+from langchain_tool_to_mcp_adapter.cli import (
+    _parse_args,
+    build_server,
+    load_tools,
+    serve,
+    signal_ready,
+)
+from langchain_tool_to_mcp_adapter.warmup import get_tool_warmup
+from .test_tools import multiply_pydantic, multiply_type_annotation
+
+
+def test_load_tools_from_attribute():
+    """Test loading a single tool by attribute."""
+    assert load_tools("tests.test_tools:multiply_pydantic") == [multiply_pydantic]
+
+
+def test_load_tools_from_module():
+    """Test loading every tool defined in a module."""
+    tools = load_tools("tests.test_tools")
+
+    assert tools == [multiply_type_annotation, multiply_pydantic]
+
+
+def test_load_tools_rejects_non_tools():
+    """Test that specs not resolving to tools are rejected."""
+    with pytest.raises(ValueError):
+        load_tools("tests.test_tools:CalculatorInput.model_fields")
+
+
+def test_build_server_with_runtime_options():
+    """Test that runtime options are applied to the server."""
+    args = _parse_args(
+        [
+            "serve",
+            "tests.test_tools:multiply_pydantic",
+            "--transport",
+            "streamable-http",
+            "--port",
+            "9000",
+            "--log-level",
+            "error",
+            "--slots",
+            "4",
+        ]
+    )
+
+    server = build_server(load_tools(args.tools[0]), args)
+
+    assert server.settings.port == 9000
+    assert server.settings.log_level == "ERROR"
+    assert server._tool_manager._tools["multiply_pydantic"].is_async
+
+
+def test_warmup_is_opt_in_per_tool():
+    """Test that only the tools named with --warmup are warmed up."""
+
+    def echo(text: str) -> str:
+        """Return the text."""
+        return text
+
+    def send(text: str) -> str:
+        """Send the text."""
+        return text
+
+    tools = [StructuredTool.from_function(echo), StructuredTool.from_function(send)]
+    args = _parse_args(["serve", "tests.test_tools", "--warmup", "echo"])
+
+    server = build_server(tools, args)
+
+    assert list(get_tool_warmup(server)._inputs) == ["echo"]
+
+
+@pytest.mark.parametrize("option", ["--warmup", "--cache-tool"])
+def test_unknown_tool_names_are_rejected(option, tmp_path):
+    """Test that --warmup and --cache-tool fail for tools that are not loaded."""
+    args = _parse_args(
+        ["serve", "tests.test_tools", "--result-cache", str(tmp_path), option, "ecko"]
+    )
+
+    with pytest.raises(ValueError, match=f"{option} names unknown tools: ecko"):
+        build_server([multiply_pydantic], args)
+
+
+def test_signal_ready_writes_ready_file(tmp_path):
+    """Test that the readiness signal creates the ready file."""
+    ready_file = tmp_path / "ready"
+
+    signal_ready(str(ready_file))
+
+    assert ready_file.read_text().isdigit()
+
+
+def test_http_server_is_ready_once_listening(tmp_path):
+    """Test that the ready file appears once the port accepts connections."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    ready_file = tmp_path / "ready"
+    args = _parse_args(
+        [
+            "serve",
+            "tests.test_tools:multiply_pydantic",
+            "--transport",
+            "streamable-http",
+            "--port",
+            str(port),
+            "--log-level",
+            "error",
+            "--ready-file",
+            str(ready_file),
+        ]
+    )
+    server = build_server(load_tools(args.tools[0]), args)
+
+    async def run():
+        task = asyncio.create_task(serve(server, args))
+        while not ready_file.exists():
+            assert not task.done()
+            await asyncio.sleep(0.01)
+        # The port is bound when readiness is signaled
+        socket.create_connection(("127.0.0.1", port), timeout=1).close()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+
+    assert not os.path.exists(ready_file)
@@ -0,0 +1,144 @@
+"""
+Tests for HTTP response compression.
+"""
+
+import asyncio
+import zlib
+
+from langchain_tool_to_mcp_adapter.compression import (
+    CompressionMiddleware,
+    negotiate_encoding,
+)
+
+
+def _app(content_type, chunks, pause=0.0):
+    async def app(scope, receive, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", content_type)],
+            }
+        )
+        for index, chunk in enumerate(chunks):
+            if index:
+                await asyncio.sleep(pause)
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": index < len(chunks) - 1,
+                }
+            )
+
+    return app
+
+
+def _send_request(app, accept_encoding=b"gzip", minimum_size=100):
+    middleware = CompressionMiddleware(
+        app, minimum_size=minimum_size, encodings=("gzip",)
+    )
+    scope = {"type": "http", "headers": [(b"accept-encoding", accept_encoding)]}
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(middleware(scope, None, send))
+    return messages
+
+
+def _request(app, accept_encoding=b"gzip", minimum_size=100):
+    messages = _send_request(app, accept_encoding, minimum_size)
+    return dict(messages[0]["headers"]), [m["body"] for m in messages[1:]]
+
+
+def test_negotiate_encoding():
+    """Test that the server's most preferred accepted encoding is picked."""
+    assert negotiate_encoding("gzip, zstd", ("zstd", "gzip")) == "zstd"
+    assert negotiate_encoding("gzip, zstd;q=0", ("zstd", "gzip")) == "gzip"
+    assert negotiate_encoding("br", ("zstd", "gzip")) is None
+    assert negotiate_encoding("", ("zstd", "gzip")) is None
+
+
+def test_large_response_is_compressed():
+    """Test that complete responses above the threshold are compressed."""
+    body = b'{"blob": "' + b"QUJD" * 1000 + b'"}'
+
+    headers, chunks = _request(_app(b"application/json", [body]))
+
+    assert headers[b"content-encoding"] == b"gzip"
+    assert int(headers[b"content-length"]) == len(chunks[0]) < len(body)
+    assert zlib.decompress(chunks[0], 31) == body
+
+
+def test_small_or_unaccepted_response_is_not_compressed():
+    """Test that small responses and clients without gzip are left alone."""
+    small_headers, small_chunks = _request(_app(b"application/json", [b"{}"]))
+    large = b"x" * 1000
+    plain_headers, plain_chunks = _request(
+        _app(b"application/json", [large]), accept_encoding=b"identity"
+    )
+
+    assert b"content-encoding" not in small_headers
+    assert small_chunks == [b"{}"]
+    assert b"content-encoding" not in plain_headers
+    assert plain_chunks == [large]
+
+
+def test_event_stream_is_compressed_incrementally():
+    """Test that each streamed event can be decoded as soon as it arrives."""
+    events = [b"event: message\ndata: " + b"A" * 200 + b"\n\n", b"data: end\n\n"]
+
+    headers, chunks = _request(_app(b"text/event-stream", events))
+
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    decompressor = zlib.decompressobj(31)
+    assert decompressor.decompress(chunks[0]) == events[0]
+    assert decompressor.decompress(chunks[1]) == events[1]
+
+
+def test_small_stream_is_not_compressed():
+    """Test that a streamed response below the threshold is left alone."""
+    events = [b"data: one\n\n", b"data: two\n\n", b""]
+
+    headers, chunks = _request(_app(b"text/event-stream", events))
+
+    assert b"content-encoding" not in headers
+    assert b"".join(chunks) == b"".join(events)
+
+
+def test_paused_stream_is_compressed():
+    """Test that a long-lived stream is not held back below the threshold."""
+    events = [b"event: endpoint\ndata: /messages\n\n", b"data: " + b"B" * 200]
+
+    headers, chunks = _request(_app(b"text/event-stream", events, pause=0.1))
+
+    assert headers[b"content-encoding"] == b"gzip"
+    decompressor = zlib.decompressobj(31)
+    # The first event was sent on its own, before the second one was ready
+    assert decompressor.decompress(chunks[0]) == events[0]
+    assert decompressor.decompress(chunks[1]) == events[1]
+
+
+def test_start_is_sent_before_other_messages():
+    """Test that a held response start precedes non-body messages."""
+
+    async def app(scope, receive, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json")],
+                "trailers": True,
+            }
+        )
+        await send({"type": "http.response.trailers", "headers": []})
+
+    messages = _send_request(app)
+
+    assert [message["type"] for message in messages] == [
+        "http.response.start",
+        "http.response.trailers",
+    ]
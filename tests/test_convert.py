@@ -2,9 +2,24 @@
 Tests for the adapter module functionality.
 """
 
+import asyncio
+import json
+from contextlib import contextmanager
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from langchain_core.tools import StructuredTool
+from mcp.server import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+from pydantic import BaseModel, field_validator
+
 from langchain_tool_to_mcp_adapter import add_langchain_tool_to_server
-from langchain_tool_to_mcp_adapter.adapter import reconstruct_func_from_tool
-from .test_tools import multiply_type_annotation, multiply_pydantic
+from langchain_tool_to_mcp_adapter.adapter import (
+    compile_arg_model,
+    reconstruct_func_from_tool,
+)
+from .test_tools import CalculatorInput, multiply_type_annotation, multiply_pydantic
 
 
 def test_reconstruct_type_annotation_tool():
@@ -63,3 +78,244 @@ def test_add_tools_to_server(empty_server, mock_tool, mock_artifact_tool):
         tools_dict[artifact_func_name].description
         == "A mock tool that returns artifacts"
     )
+
+
+def test_args_schema_is_the_single_validator(empty_server):
+    """Test that a tool's args_schema drives the registered argument model."""
+    add_langchain_tool_to_server(empty_server, multiply_pydantic)
+
+    registered = empty_server._tool_manager._tools[multiply_pydantic.func.__name__]
+
+    # The published schema comes from the args_schema, descriptions included
+    properties = registered.parameters["properties"]
+    assert properties["a"]["description"] == "first number"
+    assert properties["b"]["description"] == "second number"
+
+    # The argument model is compiled once per args_schema
+    assert issubclass(registered.fn_metadata.arg_model, CalculatorInput)
+    assert compile_arg_model(CalculatorInput) is compile_arg_model(CalculatorInput)
+
+
+def test_call_with_args_schema_validation(empty_server):
+    """Test that validated arguments are passed straight to the tool function."""
+    add_langchain_tool_to_server(empty_server, multiply_pydantic)
+    name = multiply_pydantic.func.__name__
+
+    content, _ = asyncio.run(empty_server.call_tool(name, {"a": 6, "b": "7"}))
+    assert content[0].text == "42"
+
+    with pytest.raises(ToolError):
+        asyncio.run(empty_server.call_tool(name, {"a": 6}))
+
+
+def test_json_schema_args_schema(empty_server):
+    """Test that tools with a JSON schema dict as args_schema are registered."""
+
+    def double(a: int) -> int:
+        return a * 2
+
+    tool = StructuredTool(
+        name="double",
+        description="Double a number.",
+        args_schema={
+            "type": "object",
+            "properties": {"a": {"type": "integer"}},
+            "required": ["a"],
+        },
+        func=double,
+    )
+
+    add_langchain_tool_to_server(empty_server, tool)
+
+    content, _ = asyncio.run(empty_server.call_tool("double", {"a": 21}))
+    assert content[0].text == "42"
+
+
+class Report(BaseModel):
+    title: str
+    rows: List[Dict[str, int]]
+
+
+def test_structured_output_from_return_annotation(empty_server):
+    """Test that annotated results are returned as structured content."""
+
+    def build_report(title: str, size: int) -> Report:
+        """Build a report with the given number of rows."""
+        return Report(title=title, rows=[{"n": n} for n in range(size)])
+
+    report_tool = StructuredTool.from_function(build_report)
+    add_langchain_tool_to_server(empty_server, report_tool, structured_output=True)
+
+    registered = empty_server._tool_manager._tools["build_report"]
+    assert registered.output_schema["properties"]["title"]["type"] == "string"
+
+    content, structured = asyncio.run(
+        empty_server.call_tool("build_report", {"title": "t", "size": 2})
+    )
+    assert structured == {"title": "t", "rows": [{"n": 0}, {"n": 1}]}
+    assert json.loads(content[0].text) == structured
+
+
+def test_structured_output_wraps_non_object_results(empty_server):
+    """Test that list results are wrapped and kept as a single content block."""
+
+    def list_rows(size: int) -> List[Dict[str, int]]:
+        """List the given number of rows."""
+        return [{"n": n} for n in range(size)]
+
+    add_langchain_tool_to_server(
+        empty_server, StructuredTool.from_function(list_rows), structured_output=True
+    )
+
+    content, structured = asyncio.run(empty_server.call_tool("list_rows", {"size": 3}))
+    assert structured == {"result": [{"n": 0}, {"n": 1}, {"n": 2}]}
+    assert len(content) == 1
+    assert json.loads(content[0].text) == structured["result"]
+
+
+def test_structured_output_is_validated(empty_server):
+    """Test that results not matching the output schema are rejected."""
+
+    def count_rows(table: str) -> Dict[str, int]:
+        """Count the rows of a table."""
+        return {table: "many"}
+
+    add_langchain_tool_to_server(
+        empty_server, StructuredTool.from_function(count_rows), structured_output=True
+    )
+
+    with pytest.raises(ToolError):
+        asyncio.run(empty_server.call_tool("count_rows", {"table": "users"}))
+
+
+def test_shared_resources_follow_server_lifespan(empty_server):
+    """Test that resources are opened once, injected, and closed on shutdown."""
+    events = []
+
+    @contextmanager
+    def open_session():
+        events.append("open")
+        yield {"calls": 0}
+        events.append("close")
+
+    def fetch(url: str, session: dict) -> str:
+        """Fetch a URL."""
+        session["calls"] += 1
+        return f"{url} #{session['calls']}"
+
+    def search(query: str, session: dict) -> str:
+        """Search for a query."""
+        session["calls"] += 1
+        return f"{query} #{session['calls']}"
+
+    for func in (fetch, search):
+        add_langchain_tool_to_server(
+            empty_server,
+            StructuredTool.from_function(func),
+            resources={"session": open_session},
+        )
+
+    registered = empty_server._tool_manager._tools["fetch"]
+    assert "session" not in registered.parameters["properties"]
+
+    async def run():
+        lowlevel_server = empty_server._mcp_server
+        async with lowlevel_server.lifespan(lowlevel_server):
+            assert events == ["open"]
+            first = await empty_server.call_tool("fetch", {"url": "a"})
+            second = await empty_server.call_tool("search", {"query": "b"})
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first[0][0].text == "a #1"
+    assert second[0][0].text == "b #2"
+    assert events == ["open", "close"]
+
+
+class QueryInput(BaseModel):
+    sql: str
+    session: Any = None
+
+    @field_validator("sql")
+    @classmethod
+    def only_select(cls, sql):
+        if not sql.lower().startswith("select"):
+            raise ValueError("Only SELECT queries are allowed")
+        return sql
+
+
+def test_resources_keep_args_schema_validators(empty_server):
+    """Test that injecting a resource does not disable input validators."""
+
+    def query(sql: str, session: Any = None) -> str:
+        """Run a query."""
+        return f"{sql} on {session['name']}"
+
+    tool = StructuredTool.from_function(query, args_schema=QueryInput)
+    add_langchain_tool_to_server(
+        empty_server, tool, resources={"session": lambda: {"name": "db"}}
+    )
+
+    registered = empty_server._tool_manager._tools["query"]
+    assert list(registered.parameters["properties"]) == ["sql"]
+
+    async def run():
+        lowlevel_server = empty_server._mcp_server
+        async with lowlevel_server.lifespan(lowlevel_server):
+            result = await empty_server.call_tool("query", {"sql": "select 1"})
+            with pytest.raises(ToolError):
+                await empty_server.call_tool("query", {"sql": "drop table x"})
+        return result
+
+    assert asyncio.run(run())[0][0].text == "select 1 on db"
+
+
+def test_shared_resources_outlive_http_sessions():
+    """Test that stateless HTTP requests share resources opened with the app."""
+    events = []
+
+    @contextmanager
+    def open_session():
+        events.append("open")
+        yield {"calls": 0}
+        events.append("close")
+
+    def fetch(url: str, session: dict) -> str:
+        """Fetch a URL."""
+        session["calls"] += 1
+        return f"{url} #{session['calls']}"
+
+    server = FastMCP(stateless_http=True, json_response=True, log_level="ERROR")
+    add_langchain_tool_to_server(
+        server, StructuredTool.from_function(fetch), resources={"session": open_session}
+    )
+
+    async def run():
+        app = server.streamable_http_app()
+        transport = httpx.ASGITransport(app=app)
+        results = []
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://127.0.0.1:8000"
+            ) as client:
+                # Each stateless request runs in a session of its own
+                for request_id in range(2):
+                    response = await client.post(
+                        "/mcp",
+                        json={
+                            "jsonrpc": "2.0",
+                            "id": request_id,
+                            "method": "tools/call",
+                            "params": {"name": "fetch", "arguments": {"url": "a"}},
+                        },
+                        headers={"accept": "application/json, text/event-stream"},
+                    )
+                    results.append(response.json()["result"]["content"][0]["text"])
+                    # Let the request's session end before the next one
+                    await asyncio.sleep(0.05)
+            assert events == ["open"]
+        return results
+
+    assert asyncio.run(run()) == ["a #1", "a #2"]
+    assert events == ["open", "close"]
@@ -0,0 +1,38 @@
+"""
+Tests for the package's import-time behaviour.
+"""
+
+import langchain_tool_to_mcp_adapter
+from langchain_tool_to_mcp_adapter.benchmarks.import_time import (
+    ADAPTER_HEAVY_MODULES,
+    ADAPTER_IMPORT,
+    HEAVY_MODULES,
+    PACKAGE_IMPORT,
+    measure,
+)
+
+
+def test_package_import_is_lazy():
+    """Test that importing the package does not load heavy dependencies."""
+    _, modules = measure(PACKAGE_IMPORT, runs=1)
+
+    assert not modules.intersection(HEAVY_MODULES)
+
+
+def test_adapter_import_skips_optional_features():
+    """Test that importing the adapter does not load optional dependencies."""
+    _, modules = measure(ADAPTER_IMPORT, runs=1)
+
+    assert "mcp" in modules
+    assert not modules.intersection(ADAPTER_HEAVY_MODULES)
+
+
+def test_exports_resolve_on_first_access():
+    """Test that lazily imported exports are available from the package."""
+    from langchain_tool_to_mcp_adapter.adapter import add_langchain_tool_to_server
+
+    assert (
+        langchain_tool_to_mcp_adapter.add_langchain_tool_to_server
+        is add_langchain_tool_to_server
+    )
+    assert "ArtifactCache" in dir(langchain_tool_to_mcp_adapter)
@@ -0,0 +1,48 @@
+"""
+Tests for the load-testing harness.
+"""
+
+import asyncio
+
+from langchain_tool_to_mcp_adapter.benchmarks.load_test import (
+    _parse_args,
+    parse_mix,
+    percentile,
+    run_load_test,
+)
+
+
+def test_parse_mix():
+    """Test that mix entries get weights, default and explicit arguments."""
+    mix = parse_mix(["echo:3", 'sleep:1:{"milliseconds": 5}', "artifact"], 100)
+
+    assert mix == [
+        ("echo", 3.0, {"text": "hello"}),
+        ("sleep", 1.0, {"milliseconds": 5}),
+        ("artifact", 1.0, {"size": 100}),
+    ]
+
+
+def test_percentile():
+    """Test nearest-rank percentiles."""
+    values = list(range(1, 101))
+
+    assert percentile(values, 0.50) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile([7], 0.95) == 7
+    assert percentile([], 0.5) is None
+
+
+def test_stdio_load_test():
+    """Test a short load test against a stdio server."""
+    args = _parse_args(
+        ["--clients", "2", "--duration", "1", "--mix", "echo:4", "artifact:1"]
+    )
+
+    report = asyncio.run(run_load_test(args))
+
+    assert report["requests"] > 0
+    assert report["errors"] == 0
+    assert set(report["tools"]) <= {"echo", "artifact"}
+    assert report["latency_ms"]["p50"] <= report["latency_ms"]["p99"]
+    assert report["rss_mib"][-1][1] > 0
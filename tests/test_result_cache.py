@@ -0,0 +1,137 @@
+"""
+Tests for the persistent result cache.
+"""
+
+import asyncio
+import os
+import pickle
+import sqlite3
+import subprocess
+import sys
+
+from langchain_core.tools import StructuredTool
+from mcp.server import FastMCP
+
+from langchain_tool_to_mcp_adapter import ResultCache, add_langchain_tool_to_server
+
+
+def test_results_survive_restarts(tmp_path):
+    """Test that small and blob-backed results are read by a new instance."""
+    cache = ResultCache(tmp_path, blob_threshold=1024)
+    small = cache.key("report", None, (), {"id": 1})
+    large = cache.key("report", None, (), {"id": 2})
+    cache.put(small, "report", {"rows": [1, 2]})
+    cache.put(large, "report", ("text", ["x" * 4096]))
+
+    restarted = ResultCache(tmp_path, blob_threshold=1024)
+
+    assert restarted.get(small) == (True, {"rows": [1, 2]})
+    # Tuples come back as JSON arrays
+    assert restarted.get(large) == (True, ["text", ["x" * 4096]])
+    assert len(os.listdir(tmp_path / "blobs")) == 1
+
+
+def test_results_are_shared_across_processes(tmp_path):
+    """Test that a result stored by another process is found."""
+    code = (
+        "import sys\n"
+        "from langchain_tool_to_mcp_adapter.result_cache import ResultCache\n"
+        "cache = ResultCache(sys.argv[1])\n"
+        "cache.put(cache.key('query', '1', (), {'q': 'a'}), 'query', 42)\n"
+    )
+    subprocess.run([sys.executable, "-c", code, str(tmp_path)], check=True)
+
+    cache = ResultCache(tmp_path)
+
+    assert cache.get(cache.key("query", "1", (), {"q": "a"})) == (True, 42)
+
+
+def test_keys_canonicalize_arguments():
+    """Test that keys ignore argument order but not the tool version."""
+    key = ResultCache.key
+
+    assert key("t", "1", (), {"a": 1, "b": [2]}) == key(
+        "t", "1", (), {"b": [2], "a": 1}
+    )
+    assert key("t", "1", (), {"a": 1}) != key("t", "2", (), {"a": 1})
+    assert key("t", "1", (), {"a": 1}) != key("u", "1", (), {"a": 1})
+
+
+def test_least_recently_used_results_are_evicted(tmp_path):
+    """Test that the cache stays within its size limit."""
+    cache = ResultCache(tmp_path, max_bytes=3000, blob_threshold=512)
+    keys = [cache.key("t", None, (), {"i": i}) for i in range(3)]
+    cache.put(keys[0], "t", "0" * 1000)
+    cache.put(keys[1], "t", "1" * 1000)
+    cache.get(keys[0])
+    cache.put(keys[2], "t", "2" * 1000)
+
+    assert cache.get(keys[1]) == (False, None)
+    assert cache.get(keys[0])[0] and cache.get(keys[2])[0]
+    assert cache.stats()["bytes"] <= 3000
+    assert len(os.listdir(tmp_path / "blobs")) == 2
+
+
+def test_entries_are_never_unpickled(tmp_path):
+    """Test that a pickle planted in the cache is discarded, not loaded."""
+    cache = ResultCache(tmp_path)
+    key = cache.key("t", None, (), {})
+    cache.put(key, "t", "result")
+    with sqlite3.connect(tmp_path / "results.sqlite") as connection:
+        connection.execute(
+            "UPDATE results SET value = ? WHERE key = ?",
+            (pickle.dumps(os.getcwd), key),
+        )
+
+    assert cache.get(key) == (False, None)
+    assert len(cache) == 0
+
+
+def test_failing_cache_falls_back_to_the_tool(tmp_path):
+    """Test that calls run the tool when the cache database fails."""
+    calls = []
+
+    def lookup(key: str) -> str:
+        """Look up a key."""
+        calls.append(key)
+        return key
+
+    cache = ResultCache(tmp_path)
+    server = FastMCP()
+    add_langchain_tool_to_server(
+        server, StructuredTool.from_function(lookup), result_cache=cache
+    )
+    with cache._connection() as connection:
+        connection.execute("DROP TABLE results")
+
+    asyncio.run(server.call_tool("lookup", {"key": "a"}))
+
+    assert calls == ["a"]
+    # Reopening the cache recreates the table, so stats() works again
+    ResultCache(tmp_path)
+    assert cache.stats()["errors"] == 2
+
+
+def test_adapted_tool_uses_result_cache(tmp_path):
+    """Test that repeated calls of an adapted tool are served from the cache."""
+    calls = []
+
+    def build_report(quarter: str) -> str:
+        """Build an expensive report."""
+        calls.append(quarter)
+        return f"Report for {quarter}"
+
+    tool = StructuredTool.from_function(build_report, metadata={"version": "1"})
+
+    async def call_twice(server):
+        first = await server.call_tool("build_report", {"quarter": "Q1"})
+        second = await server.call_tool("build_report", {"quarter": "Q1"})
+        return first, second
+
+    for _ in range(2):
+        server = FastMCP()
+        add_langchain_tool_to_server(server, tool, result_cache=ResultCache(tmp_path))
+        first, second = asyncio.run(call_twice(server))
+        assert first == second
+
+    assert calls == ["Q1"]
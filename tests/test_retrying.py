@@ -0,0 +1,181 @@
+"""
+Tests for retried and hedged tool calls.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from langchain_core.tools import StructuredTool
+from mcp.server import FastMCP
+
+from langchain_tool_to_mcp_adapter import (
+    ResultCache,
+    RetryPolicy,
+    add_langchain_tool_to_server,
+)
+from langchain_tool_to_mcp_adapter.retrying import retry_tool_calls, time_tool_calls
+
+
+def _flaky(failures, error=ConnectionError):
+    calls = []
+
+    def func(x):
+        calls.append(x)
+        if len(calls) <= failures:
+            raise error("downstream unavailable")
+        return x * 2
+
+    return func, calls
+
+
+def test_transient_errors_are_retried():
+    """Test that declared transient errors are retried until success."""
+    func, calls = _flaky(2)
+    policy = RetryPolicy(attempts=3, backoff=0.001)
+
+    assert asyncio.run(retry_tool_calls(func, policy)(x=4)) == 8
+    assert len(calls) == 3
+    assert policy.stats()["retries"] == 2
+
+
+def test_retries_are_bounded():
+    """Test that the last transient error is raised after all attempts."""
+    func, calls = _flaky(5)
+    policy = RetryPolicy(attempts=2, backoff=0.001)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(retry_tool_calls(func, policy)(x=4))
+    assert len(calls) == 2
+    assert policy.stats()["failures"] == 1
+
+
+def test_other_errors_are_not_retried():
+    """Test that undeclared exceptions are raised immediately."""
+    func, calls = _flaky(1, error=ValueError)
+
+    with pytest.raises(ValueError):
+        asyncio.run(retry_tool_calls(func, RetryPolicy(backoff=0.001))(x=4))
+    assert len(calls) == 1
+
+
+def test_backoff_grows_exponentially_up_to_the_cap():
+    """Test the backoff delays without jitter."""
+    policy = RetryPolicy(backoff=0.1, max_backoff=0.3, jitter=False)
+
+    assert [policy.backoff_delay(n) for n in (1, 2, 3)] == [0.1, 0.2, 0.3]
+
+
+def test_slow_attempts_are_hedged():
+    """Test that a duplicate attempt wins over an attempt in the latency tail."""
+    stalled = threading.Event()
+    calls = []
+
+    def func(x):
+        calls.append(x)
+        if x == "slow" and len(calls) == 4:
+            stalled.wait(5)
+        return x
+
+    policy = RetryPolicy(hedge_percentile=0.9, hedge_min_samples=3)
+    wrapper = retry_tool_calls(time_tool_calls(func), policy)
+
+    async def run():
+        for _ in range(3):
+            await wrapper(x="fast")
+        started = time.perf_counter()
+        result = await wrapper(x="slow")
+        return result, time.perf_counter() - started
+
+    try:
+        result, elapsed = asyncio.run(run())
+    finally:
+        stalled.set()
+
+    assert result == "slow"
+    assert elapsed < 1
+    assert policy.stats()["hedges"] == 1
+    assert policy.stats()["hedge_wins"] == 1
+
+
+def test_backoff_does_not_block_other_tools(empty_server):
+    """Test that other tools stay responsive while a call backs off."""
+    func, _ = _flaky(1)
+
+    def lookup(x: int) -> int:
+        """Look up a value in a flaky service."""
+        return func(x)
+
+    def echo(text: str) -> str:
+        """Return the text."""
+        return text
+
+    add_langchain_tool_to_server(
+        empty_server,
+        StructuredTool.from_function(lookup),
+        retry=RetryPolicy(backoff=0.5, jitter=False),
+    )
+    add_langchain_tool_to_server(empty_server, StructuredTool.from_function(echo))
+
+    async def run():
+        retried = asyncio.ensure_future(empty_server.call_tool("lookup", {"x": 1}))
+        await asyncio.sleep(0.05)
+        started = time.perf_counter()
+        await empty_server.call_tool("echo", {"text": "hi"})
+        elapsed = time.perf_counter() - started
+        await retried
+        return elapsed
+
+    assert asyncio.run(run()) < 0.2
+
+
+def test_adapted_tool_is_retried():
+    """Test that a policy applies to calls through the MCP server."""
+    func, calls = _flaky(1)
+
+    def lookup(x: int) -> int:
+        """Look up a value in a flaky service."""
+        return func(x)
+
+    server = FastMCP()
+    add_langchain_tool_to_server(
+        server,
+        StructuredTool.from_function(lookup),
+        retry=RetryPolicy(backoff=0.001),
+    )
+
+    result = asyncio.run(server.call_tool("lookup", {"x": 21}))
+
+    assert result[1] == {"result": 42}
+    assert len(calls) == 2
+
+
+def test_cache_hits_are_not_hedge_samples(tmp_path):
+    """Test that fast cache hits do not make cache misses look slow."""
+    calls = []
+
+    def build_report(quarter: int) -> int:
+        """Build an expensive report."""
+        calls.append(quarter)
+        time.sleep(0.2)
+        return quarter
+
+    policy = RetryPolicy(hedge_percentile=0.95, hedge_min_samples=5)
+    server = FastMCP()
+    add_langchain_tool_to_server(
+        server,
+        StructuredTool.from_function(build_report),
+        result_cache=ResultCache(tmp_path),
+        retry=policy,
+    )
+
+    async def run():
+        for _ in range(40):
+            await server.call_tool("build_report", {"quarter": 1})
+        await server.call_tool("build_report", {"quarter": 2})
+
+    asyncio.run(run())
+
+    assert calls == [1, 2]
+    assert policy.stats()["hedges"] == 0
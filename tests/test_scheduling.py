@@ -0,0 +1,76 @@
+"""
+Tests for priority-aware scheduling of tool calls.
+"""
+
+import asyncio
+import threading
+
+from langchain_core.tools import Tool
+
+from langchain_tool_to_mcp_adapter import (
+    PriorityScheduler,
+    add_langchain_tool_to_server,
+)
+
+
+async def _run_queued(scheduler, priorities):
+    """Queue calls behind a blocking call and return the order they ran in."""
+    gate = threading.Event()
+    order = []
+
+    blocker = asyncio.create_task(scheduler.run("normal", gate.wait))
+    await asyncio.sleep(0.01)
+
+    queued = []
+    for priority in priorities:
+        queued.append(
+            asyncio.create_task(scheduler.run(priority, order.append, priority))
+        )
+        await asyncio.sleep(0.01)
+
+    metrics = scheduler.metrics()
+    gate.set()
+    await asyncio.gather(blocker, *queued)
+    return order, metrics
+
+
+def test_higher_priority_runs_first():
+    """Test that free slots go to the most urgent waiting call."""
+    scheduler = PriorityScheduler(slots=1)
+
+    order, metrics = asyncio.run(
+        _run_queued(scheduler, ["background", "normal", "interactive"])
+    )
+
+    assert order == ["interactive", "normal", "background"]
+    assert metrics["background"]["queued"] == 1
+    assert metrics["normal"]["running"] == 1
+    assert scheduler.metrics()["background"]["completed"] == 1
+
+
+def test_aging_prevents_starvation():
+    """Test that long-waiting calls overtake newer, more urgent ones."""
+    scheduler = PriorityScheduler(slots=1, aging_interval=0.001)
+
+    order, _ = asyncio.run(_run_queued(scheduler, ["background", "interactive"]))
+
+    assert order == ["background", "interactive"]
+
+
+def test_scheduled_tool_call(empty_server):
+    """Test that scheduled tools are registered as async and run in a slot."""
+    scheduler = PriorityScheduler(slots=2)
+
+    def echo(text):
+        return f"echo: {text}"
+
+    tool = Tool(name="echo", description="Echo the input", func=echo)
+
+    add_langchain_tool_to_server(
+        empty_server, tool, scheduler=scheduler, priority="background"
+    )
+
+    assert empty_server._tool_manager._tools["echo"].is_async
+    content = asyncio.run(empty_server.call_tool("echo", {"text": "hi"}))
+    assert content[0].text == "echo: hi"
+    assert scheduler.metrics()["background"]["completed"] == 1
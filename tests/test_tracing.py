@@ -0,0 +1,87 @@
+"""
+Tests for sampled LangChain callback/tracing integration.
+"""
+
+import asyncio
+
+import pytest
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.tools import StructuredTool
+from mcp.server.fastmcp.exceptions import ToolError
+
+from langchain_tool_to_mcp_adapter import TracingPolicy, add_langchain_tool_to_server
+
+
+class RecordingHandler(BaseCallbackHandler):
+    def __init__(self):
+        self.events = []
+
+    def on_tool_start(self, serialized, input_str, metadata=None, **kwargs):
+        self.events.append(("start", serialized["name"], kwargs["inputs"], metadata))
+
+    def on_tool_end(self, output, **kwargs):
+        self.events.append(("end", output))
+
+    def on_tool_error(self, error, **kwargs):
+        self.events.append(("error", str(error)))
+
+
+def divide(a: int, b: int) -> float:
+    """Divide a by b."""
+    return a / b
+
+
+def _call(server, arguments):
+    return asyncio.run(server.call_tool("divide", arguments))
+
+
+def test_untraced_calls_skip_callbacks(empty_server):
+    """Test that calls outside the sample run without callbacks."""
+    handler = RecordingHandler()
+    policy = TracingPolicy(sample_rate=0.0, callbacks=[handler])
+    add_langchain_tool_to_server(
+        empty_server, StructuredTool.from_function(divide), tracing=policy
+    )
+
+    _call(empty_server, {"a": 1, "b": 2})
+
+    assert handler.events == []
+    assert policy.stats()["calls"] == 1
+
+
+def test_sampled_calls_are_traced(empty_server):
+    """Test that sampled calls are reported to the callbacks."""
+    handler = RecordingHandler()
+    policy = TracingPolicy(sample_rate=1.0, callbacks=[handler])
+    add_langchain_tool_to_server(
+        empty_server, StructuredTool.from_function(divide), tracing=policy
+    )
+
+    _call(empty_server, {"a": 1, "b": 2})
+    with pytest.raises(ToolError):
+        _call(empty_server, {"a": 1, "b": 0})
+
+    assert handler.events == [
+        ("start", "divide", {"a": 1, "b": 2}, {}),
+        ("end", 0.5),
+        ("start", "divide", {"a": 1, "b": 0}, {}),
+        ("error", "division by zero"),
+    ]
+    assert policy.stats()["sampled"] == 2
+
+
+def test_slow_calls_are_reported_with_latency(empty_server):
+    """Test that calls above the latency threshold are reported afterwards."""
+    handler = RecordingHandler()
+    policy = TracingPolicy(latency_threshold=0.0, callbacks=[handler])
+    add_langchain_tool_to_server(
+        empty_server, StructuredTool.from_function(divide), tracing=policy
+    )
+
+    _call(empty_server, {"a": 3, "b": 2})
+
+    (start, name, inputs, metadata), end = handler.events
+    assert (start, name, inputs) == ("start", "divide", {"a": 3, "b": 2})
+    assert metadata["latency_seconds"] >= 0
+    assert end == ("end", 1.5)
+    assert policy.stats()["slow"] == 1
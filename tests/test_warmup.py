@@ -0,0 +1,147 @@
+"""
+Tests for warming up tools before serving.
+"""
+
+import asyncio
+from typing import Literal, Optional
+
+from langchain_core.tools import StructuredTool
+from mcp.server import FastMCP
+from pydantic import BaseModel, Field
+
+from langchain_tool_to_mcp_adapter import (
+    PriorityScheduler,
+    ResultCache,
+    RetryPolicy,
+    TracingPolicy,
+    add_langchain_tool_to_server,
+)
+from langchain_tool_to_mcp_adapter.warmup import get_tool_warmup, synthesize_arguments
+from .test_tools import multiply_pydantic, multiply_type_annotation
+
+
+class Filters(BaseModel):
+    region: Literal["emea", "apac"]
+    limit: int = 10
+
+
+class QueryInput(BaseModel):
+    query: str = Field(min_length=10)
+    page: int = Field(ge=1)
+    tags: list[str] = Field(min_length=1)
+    filters: Filters
+    cursor: Optional[str] = None
+
+
+def test_synthesized_arguments_are_valid():
+    """Test that synthesized arguments pass the schema's validation."""
+    arguments = synthesize_arguments(QueryInput.model_json_schema())
+
+    assert arguments == {
+        "query": "warmupxxxx",
+        "page": 1,
+        "tags": ["warmup"],
+        "filters": {"region": "emea"},
+    }
+    QueryInput.model_validate(arguments)
+
+
+def _run_lifespan(server):
+    async def run():
+        lowlevel_server = server._mcp_server
+        async with lowlevel_server.lifespan(lowlevel_server):
+            pass
+        async with lowlevel_server.lifespan(lowlevel_server):
+            pass
+
+    asyncio.run(run())
+
+
+def test_tools_are_warmed_up_once_at_startup(empty_server):
+    """Test that warmup calls run when the server starts, and only once."""
+    calls = []
+
+    def lookup(key: str, limit: int = 5) -> str:
+        """Look up a key."""
+        calls.append((key, limit))
+        return key
+
+    add_langchain_tool_to_server(
+        empty_server, StructuredTool.from_function(lookup), warmup=True
+    )
+    add_langchain_tool_to_server(
+        empty_server, multiply_pydantic, warmup=[{"a": 2, "b": 3}, {"a": 4, "b": 5}]
+    )
+
+    _run_lifespan(empty_server)
+
+    report = get_tool_warmup(empty_server).report
+    assert calls == [("warmup", 5)]
+    assert report["tools"]["lookup"]["calls"] == 1
+    assert report["tools"]["multiply_pydantic"]["calls"] == 2
+    assert len(report["tools"]["multiply_pydantic"]["latency_ms"]) == 2
+
+
+def test_failed_warmup_calls_are_reported():
+    """Test that failing warmup calls do not prevent the server from starting."""
+    server = FastMCP()
+    # The synthesized empty list makes max() fail
+    add_langchain_tool_to_server(server, multiply_type_annotation, warmup=True)
+    get_tool_warmup(server).parallel = True
+
+    _run_lifespan(server)
+
+    report = get_tool_warmup(server).report
+    assert report["tools"]["multiply_type_annotation"]["errors"] == 1
+
+
+def test_declared_warmup_inputs_are_used(empty_server):
+    """Test that inputs declared in the tool's metadata take precedence."""
+    calls = []
+
+    def search(query: str) -> str:
+        """Search documents."""
+        calls.append(query)
+        return query
+
+    tool = StructuredTool.from_function(
+        search, metadata={"warmup_inputs": [{"query": "popular"}]}
+    )
+    add_langchain_tool_to_server(empty_server, tool, warmup=True)
+
+    _run_lifespan(empty_server)
+
+    assert calls == ["popular"]
+
+
+def test_warmup_calls_are_not_real_traffic(empty_server, tmp_path):
+    """Test that warmup calls bypass the result cache, tracing and statistics."""
+    cache = ResultCache(str(tmp_path / "cache"))
+    tracing = TracingPolicy(sample_rate=1.0)
+    retry = RetryPolicy()
+    scheduler = PriorityScheduler()
+    add_langchain_tool_to_server(
+        empty_server,
+        multiply_pydantic,
+        result_cache=cache,
+        tracing=tracing,
+        retry=retry,
+        scheduler=scheduler,
+        warmup=[{"a": 2, "b": 3}],
+    )
+
+    _run_lifespan(empty_server)
+
+    report = get_tool_warmup(empty_server).report["tools"]["multiply_pydantic"]
+    assert (report["calls"], report["errors"]) == (1, 0)
+    assert len(cache) == 0
+    assert tracing.stats()["calls"] == 0
+    assert retry.stats()["calls"] == 0
+    assert scheduler.metrics()["normal"]["completed"] == 0
+
+    asyncio.run(empty_server.call_tool("multiply_pydantic", {"a": 2, "b": 3}))
+
+    assert len(cache) == 1
+    assert tracing.stats()["calls"] == 1
+    assert retry.stats()["calls"] == 1
+    assert scheduler.metrics()["normal"]["completed"] == 1